@@ -0,0 +1,74 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+
+try:
+    import brotli
+except ImportError:  # optional: fall back to gzip only
+    brotli = None
+
+
+def _accepted_encodings(header: str) -> set:
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        name, _, quality = params.strip().partition("=")
+        try:
+            if name.strip().lower() == "q" and float(quality) == 0:
+                continue
+        except ValueError:
+            pass
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class _FlushingGZipResponder(GZipResponder):
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if more_body:
+            # Flush every chunk so streamed NDJSON lines reach the client as they are produced
+            self.gzip_file.write(body)
+            self.gzip_file.flush()
+            body = self.gzip_buffer.getvalue()
+            self.gzip_buffer.seek(0)
+            self.gzip_buffer.truncate()
+            return body
+        return super().apply_compression(body, more_body=False)
+
+
+class _BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app, minimum_size: int, quality: int):
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        compressed = self.compressor.process(body)
+        return compressed + (self.compressor.flush() if more_body else self.compressor.finish())
+
+
+class CompressionMiddleware:
+    """
+    Brotli (when the `brotli` package is installed) or gzip response compression,
+    whichever the client accepts, for bodies of at least `minimum_size` bytes.
+    Streamed responses are flushed per chunk so they stay incremental.
+    """
+
+    def __init__(self, app, minimum_size: int = 1000, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        if brotli is not None and "br" in accepted:
+            responder = _BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+        elif "gzip" in accepted:
+            responder = _FlushingGZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = self.app
+        await responder(scope, receive, send)
@@ -0,0 +1,45 @@
+import functools
+import hashlib
+from typing import Dict, Optional
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter(schema) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def dump_json(schema, value) -> bytes:
+    """
+    Validate ORM objects (or plain data) against `schema` and serialize them to JSON
+    in one pass through pydantic-core, skipping FastAPI's jsonable_encoder.
+    """
+    adapter = _adapter(schema)
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+def etag_for(body: bytes) -> str:
+    # Weak, since compression changes the bytes on the wire but not the representation
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def json_response(request: Request, body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    JSON response with an ETag; answers 304 Not Modified when the client's
+    If-None-Match already names it. Clients revalidate on every use (no-cache).
+    """
+    etag = etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", **(headers or {})}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
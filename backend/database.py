@@ -1,19 +1,86 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./jobsearch_v5.db")
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Revision matching tables created by create_all before migrations existed
+BASELINE_REVISION = "0001"
+
+# Serve the users, jobs and applications routes from an AsyncEngine (aiosqlite / asyncpg)
+ASYNC_DB = os.getenv("ASYNC_DB", "false").lower() == "true"
+
+
+def _async_url(url: str) -> str:
+    """
+    The async driver's URL for DATABASE_URL, unless ASYNC_DATABASE_URL is set.
+    """
+    explicit = os.getenv("ASYNC_DATABASE_URL")
+    if explicit:
+        return explicit
+    scheme, sep, rest = url.partition("://")
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite{sep}{rest}"
+    if scheme.startswith(("postgresql", "postgres")):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return url
+
+
+def _pool_options():
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": True,
+    }
+
+
 if "sqlite" in SQLALCHEMY_DATABASE_URL:
     engine = create_engine(
-        SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+        SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False, "timeout": 15}
     )
+
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        # WAL lets searches read while another request writes
+        cursor.execute("PRAGMA journal_mode=WAL")
+        # Safe with WAL; only the last commits can be lost on power failure
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=15000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute(f"PRAGMA cache_size=-{int(os.getenv('SQLITE_CACHE_KB', '20000'))}")
+        cursor.execute(f"PRAGMA mmap_size={int(os.getenv('SQLITE_MMAP_BYTES', str(128 * 1024 * 1024)))}")
+        cursor.close()
+
+    event.listen(engine, "connect", _set_sqlite_pragmas)
 else:
-    engine = create_engine(SQLALCHEMY_DATABASE_URL)
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, **_pool_options())
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = None
+AsyncSessionLocal = None
+if ASYNC_DB:
+    # Imported only when enabled; the drivers are optional dependencies
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    if "sqlite" in SQLALCHEMY_DATABASE_URL:
+        # SQLite has one writer; queueing on a single connection beats many connections
+        # backing off in the busy handler. Routes release it before any slow await.
+        async_engine = create_async_engine(
+            _async_url(SQLALCHEMY_DATABASE_URL), connect_args={"timeout": 15},
+            pool_size=int(os.getenv("ASYNC_SQLITE_POOL_SIZE", "1")), max_overflow=0,
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        )
+        event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    else:
+        async_engine = create_async_engine(_async_url(SQLALCHEMY_DATABASE_URL), **_pool_options())
+    # Rows stay usable after commit: lazy reloads are not possible on an async session
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -22,3 +89,26 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def init_db():
+    """
+    Bring the schema up to date with Alembic (`alembic upgrade head`).
+    Databases created by create_all before migrations existed are stamped
+    at the baseline revision first, so only later migrations run on them.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(os.path.join(BASE_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BASE_DIR, "backend", "migrations"))
+
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        tables = inspect(connection).get_table_names()
+        if "jobs" in tables and "alembic_version" not in tables:
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, "head")
@@ -0,0 +1,45 @@
+import json
+import logging
+import os
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# "text" for humans, "json" for log shippers
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    One JSON object per line: time, level, logger, message and any `extra` fields.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({k: v for k, v in vars(record).items() if k not in _RESERVED})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging():
+    """
+    Route application logs to stderr at LOG_LEVEL. Debug output (request params,
+    per-page counts) is only formatted when LOG_LEVEL=DEBUG.
+    """
+    handler = logging.StreamHandler()
+    if LOG_FORMAT == "json":
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    logger = logging.getLogger("backend")
+    logger.handlers[:] = [handler]
+    logger.setLevel(LOG_LEVEL)
+    logger.propagate = False
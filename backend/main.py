@@ -1,19 +1,94 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import os
+import time
 from fastapi.staticfiles import StaticFiles
 
 # Load environment variables
 load_dotenv()
 
-from .database import engine
+from .compression import CompressionMiddleware
+from .database import ASYNC_DB, async_engine, engine, init_db
+from .logging_config import configure_logging
 from . import models
-from .routers import users, jobs, applications
+from .routers import providers
+if ASYNC_DB:
+    # Handlers await the database instead of holding a threadpool thread per request
+    from .routers.aio import users, jobs, applications
+else:
+    from .routers import users, jobs, applications
+from .services import apply_queue, email, metrics, search_index
+from .services.ingestion import IngestionScheduler
 
-# Create database tables
-models.Base.metadata.create_all(bind=engine)
-app = FastAPI(title="Auto Job Apply System")
+configure_logging()
+metrics.instrument_engine(engine)
+if async_engine is not None:
+    metrics.instrument_engine(async_engine.sync_engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Apply database migrations here rather than at import, so importing the app
+    # never touches the database; `python -m backend.worker` does the same on start
+    init_db()
+    search_index.ensure_search_index(engine)
+    # Pick up batch applications accepted before the last restart
+    apply_queue.resume_pending()
+    # In-process ingestion; with several workers prefer `python -m backend.worker`
+    scheduler = IngestionScheduler() if os.getenv("INGESTION_ENABLED", "false").lower() == "true" else None
+    if scheduler:
+        scheduler.start()
+    yield
+    if scheduler:
+        scheduler.stop()
+    email.close_pool()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+class TimingMiddleware:
+    """
+    Records request latency (until the last body chunk, so streamed responses count
+    in full) and the SQL time spent serving it, labelled by route template.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        db_time = metrics.start_request_db_timer()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "other"
+            metrics.HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started, method=scope["method"], route=route_path, status=status_code
+            )
+            metrics.HTTP_REQUEST_DB_SECONDS.observe(db_time[0], route=route_path)
+
+
+app = FastAPI(title="Auto Job Apply System", lifespan=lifespan)
+
+# Compression sits inside the timing middleware so its cost is included in request latency
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(TimingMiddleware)
 
 
 # CORS configuration
@@ -23,12 +98,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets cross-origin clients page through /applications/{user_id}
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include Routers
 app.include_router(users.router)
 app.include_router(jobs.router)
 app.include_router(applications.router)
+app.include_router(providers.router)
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
 
 
 # Mount frontend directory
@@ -0,0 +1,61 @@
+from logging.config import fileConfig
+from alembic import context
+from backend.database import engine
+from backend import models
+
+config = context.config
+
+# Running from the CLI: use alembic.ini logging. From init_db(): keep the app's logging.
+connection = config.attributes.get("connection")
+if connection is None and config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = models.Base.metadata
+
+# Full-text tables/indexes are managed by services/search_index, not by the models
+_UNMANAGED_PREFIXES = ("jobs_fts", "ix_jobs_fulltext")
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    return not (name or "").startswith(_UNMANAGED_PREFIXES)
+
+
+def _configure(conn):
+    context.configure(
+        connection=conn,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        # SQLite can't ALTER most things in place; batch mode rebuilds the table
+        render_as_batch=conn.dialect.name == "sqlite",
+    )
+
+
+def run_migrations_offline():
+    context.configure(
+        url=str(engine.url),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    if connection is not None:
+        _configure(connection)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    with engine.connect() as conn:
+        _configure(conn)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
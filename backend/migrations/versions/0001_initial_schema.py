@@ -0,0 +1,75 @@
+"""initial schema, as created by create_all before migrations existed
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=True),
+        sa.Column('email', sa.String(), nullable=True),
+        sa.Column('skills', sa.Text(), nullable=True),
+        sa.Column('experience', sa.Text(), nullable=True),
+        sa.Column('phone_number', sa.String(), nullable=True),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('linkedin_url', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_users_id', 'users', ['id'])
+    op.create_index('ix_users_name', 'users', ['name'])
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('rapidapi_id', sa.String(), nullable=True),
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('company', sa.String(), nullable=True),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('hr_email', sa.String(), nullable=True),
+        sa.Column('url', sa.String(), nullable=True),
+        sa.Column('posted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_jobs_id', 'jobs', ['id'])
+    op.create_index('ix_jobs_rapidapi_id', 'jobs', ['rapidapi_id'], unique=True)
+
+    op.create_table(
+        'applications',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('job_id', sa.Integer(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('generated_email_content', sa.Text(), nullable=True),
+        sa.Column('applied_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_applications_id', 'applications', ['id'])
+
+
+def downgrade():
+    op.drop_index('ix_applications_id', table_name='applications')
+    op.drop_table('applications')
+    op.drop_index('ix_jobs_rapidapi_id', table_name='jobs')
+    op.drop_index('ix_jobs_id', table_name='jobs')
+    op.drop_table('jobs')
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_index('ix_users_name', table_name='users')
+    op.drop_index('ix_users_id', table_name='users')
+    op.drop_table('users')
@@ -0,0 +1,44 @@
+"""cross-provider job dedup columns and LSH buckets
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows stay unresolved (canonical_job_id NULL) and remain searchable
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.add_column(sa.Column('canonical_job_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('dedup_key', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('minhash', sa.LargeBinary(), nullable=True))
+        batch_op.create_foreign_key('fk_jobs_canonical_job_id_jobs', 'jobs', ['canonical_job_id'], ['id'])
+        batch_op.create_index('ix_jobs_canonical_job_id', ['canonical_job_id'])
+        batch_op.create_index('ix_jobs_dedup_key', ['dedup_key'])
+
+    op.create_table(
+        'job_lsh_buckets',
+        sa.Column('bucket', sa.String(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id']),
+        sa.PrimaryKeyConstraint('bucket', 'job_id'),
+    )
+
+
+def downgrade():
+    op.drop_table('job_lsh_buckets')
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_index('ix_jobs_dedup_key')
+        batch_op.drop_index('ix_jobs_canonical_job_id')
+        batch_op.drop_constraint('fk_jobs_canonical_job_id_jobs', type_='foreignkey')
+        batch_op.drop_column('minhash')
+        batch_op.drop_column('dedup_key')
+        batch_op.drop_column('canonical_job_id')
@@ -0,0 +1,25 @@
+"""hashed feature vector for profile ranking
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows get their vector computed on first ranking (services/ranking)
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.add_column(sa.Column('feature_vector', sa.LargeBinary(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_column('feature_vector')
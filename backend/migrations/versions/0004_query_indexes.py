@@ -0,0 +1,28 @@
+"""indexes for search and applications queries
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_jobs_posted_at', 'jobs', ['posted_at'])
+    op.create_index('ix_applications_job_id', 'applications', ['job_id'])
+    op.create_index('ix_applications_user_id_status', 'applications', ['user_id', 'status'])
+    op.create_index('ix_applications_user_id_applied_at', 'applications', ['user_id', 'applied_at', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_applications_user_id_applied_at', table_name='applications')
+    op.drop_index('ix_applications_user_id_status', table_name='applications')
+    op.drop_index('ix_applications_job_id', table_name='applications')
+    op.drop_index('ix_jobs_posted_at', table_name='jobs')
@@ -0,0 +1,30 @@
+"""ingestion scheduler high-water marks
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'ingestion_state',
+        sa.Column('query_key', sa.String(), nullable=False),
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_job_count', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('query_key'),
+    )
+
+
+def downgrade():
+    op.drop_table('ingestion_state')
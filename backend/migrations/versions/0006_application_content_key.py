@@ -0,0 +1,25 @@
+"""cache key for generated application emails
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('applications', sa.Column('content_key', sa.String(), nullable=True))
+    op.create_index('ix_applications_content_key', 'applications', ['content_key'])
+
+
+def downgrade():
+    op.drop_index('ix_applications_content_key', table_name='applications')
+    with op.batch_alter_table('applications') as batch_op:
+        batch_op.drop_column('content_key')
@@ -0,0 +1,37 @@
+"""per-user seen / applied / dismissed job states
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'job_interactions',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('state', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id', 'job_id', 'state'),
+    )
+    # Jobs already emailed were what /jobs/search used to filter out
+    op.execute(
+        "INSERT INTO job_interactions (user_id, job_id, state, created_at) "
+        "SELECT DISTINCT user_id, job_id, 'applied', CURRENT_TIMESTAMP FROM applications "
+        "WHERE status = 'email_sent' AND user_id IS NOT NULL AND job_id IS NOT NULL"
+    )
+
+
+def downgrade():
+    op.drop_table('job_interactions')
@@ -0,0 +1,24 @@
+"""claim time of applications taken by an apply worker
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Rows already "processing" keep NULL and are treated as stale on the next startup
+    op.add_column('applications', sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('applications') as batch_op:
+        batch_op.drop_column('claimed_at')
@@ -0,0 +1,57 @@
+"""ingestion high-water marks per provider
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+# services.providers.PROVIDER_NAMES when this revision was written
+PROVIDERS = ('linkedin', 'active_jobs', 'jsearch')
+
+
+def _create(name, key_columns):
+    columns = [sa.Column('query_key', sa.String(), nullable=False)]
+    if 'provider' in key_columns:
+        columns.append(sa.Column('provider', sa.String(), nullable=False))
+    op.create_table(
+        name,
+        *columns,
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_job_count', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint(*key_columns),
+    )
+
+
+def upgrade():
+    # The primary key changes, so the table is rebuilt; every provider starts from the shared mark
+    _create('ingestion_state_new', ['query_key', 'provider'])
+    for provider in PROVIDERS:
+        op.execute(
+            "INSERT INTO ingestion_state_new (query_key, provider, title, location, last_run_at, last_job_count) "
+            f"SELECT query_key, '{provider}', title, location, last_run_at, last_job_count FROM ingestion_state"
+        )
+    op.drop_table('ingestion_state')
+    op.rename_table('ingestion_state_new', 'ingestion_state')
+
+
+def downgrade():
+    # Keep the oldest mark of each query so no provider's window is skipped
+    _create('ingestion_state_old', ['query_key'])
+    op.execute(
+        "INSERT INTO ingestion_state_old (query_key, title, location, last_run_at, last_job_count) "
+        "SELECT query_key, MIN(title), MIN(location), "
+        "CASE WHEN COUNT(last_run_at) < COUNT(*) THEN NULL ELSE MIN(last_run_at) END, SUM(last_job_count) "
+        "FROM ingestion_state GROUP BY query_key"
+    )
+    op.drop_table('ingestion_state')
+    op.rename_table('ingestion_state_old', 'ingestion_state')
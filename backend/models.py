@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, LargeBinary, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
@@ -29,19 +29,62 @@ class Job(Base):
     description = Column(Text)
     hr_email = Column(String, nullable=True)
     url = Column(String)
-    posted_at = Column(DateTime(timezone=True), nullable=True)
+    posted_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    # Cross-provider dedup: NULL until resolved, then own id (canonical) or the canonical job's id
+    canonical_job_id = Column(Integer, ForeignKey("jobs.id"), nullable=True, index=True)
+    dedup_key = Column(String, nullable=True, index=True)
+    minhash = Column(LargeBinary, nullable=True)
+    # Hashed TF feature vector for profile ranking, computed once when stored
+    feature_vector = Column(LargeBinary, nullable=True)
 
     applications = relationship("Application", back_populates="job")
 
+class JobLSHBucket(Base):
+    __tablename__ = "job_lsh_buckets"
+
+    bucket = Column(String, primary_key=True)
+    job_id = Column(Integer, ForeignKey("jobs.id"), primary_key=True)
+
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # Serves ?status= on /applications
+        Index("ix_applications_user_id_status", "user_id", "status"),
+        # Serves the keyset-paginated /applications/{user_id} listing
+        Index("ix_applications_user_id_applied_at", "user_id", "applied_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
-    job_id = Column(Integer, ForeignKey("jobs.id"))
+    job_id = Column(Integer, ForeignKey("jobs.id"), index=True)
     status = Column(String, default="applied")
     generated_email_content = Column(Text)
+    # email_agent.content_key of the inputs that produced generated_email_content
+    content_key = Column(String, nullable=True, index=True)
     applied_at = Column(DateTime(timezone=True), server_default=func.now())
+    # When an apply worker moved the row to "processing" (see services/apply_queue)
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
 
     user = relationship("User", back_populates="applications")
     job = relationship("Job", back_populates="applications")
+
+class JobInteraction(Base):
+    __tablename__ = "job_interactions"
+
+    # One row per state a user reached for a job: seen, applied or dismissed (see services/seen_jobs)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    job_id = Column(Integer, ForeignKey("jobs.id"), primary_key=True)
+    state = Column(String, primary_key=True)
+    created_at = Column(DateTime(timezone=True), nullable=True)
+
+class IngestionState(Base):
+    __tablename__ = "ingestion_state"
+
+    # Canonical filters of one scheduled query (see services/ingestion), per provider
+    query_key = Column(String, primary_key=True)
+    provider = Column(String, primary_key=True)
+    title = Column(String)
+    location = Column(String, nullable=True)
+    # High-water mark: this provider's postings older than this were fetched by an earlier run
+    last_run_at = Column(DateTime(timezone=True), nullable=True)
+    last_job_count = Column(Integer, default=0)
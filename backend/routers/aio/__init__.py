@@ -0,0 +1,4 @@
+"""
+`async def` versions of the users, jobs and applications routers on the AsyncEngine.
+main.py serves these instead of the sync routers when ASYNC_DB=true.
+"""
@@ -0,0 +1,90 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import List, Optional
+from ... import models, schemas
+from ...database import get_async_db
+from ...services import apply_queue, seen_jobs
+from ..applications import _page_response, _page_statement
+
+router = APIRouter(
+    tags=["applications"]
+)
+
+
+async def _with_jobs(db: AsyncSession, application_ids: List[int]) -> List[models.Application]:
+    # Load server defaults (applied_at) and the job in one query; async sessions cannot lazy load
+    result = await db.scalars(
+        select(models.Application)
+        .options(selectinload(models.Application.job))
+        .where(models.Application.id.in_(application_ids))
+        .order_by(models.Application.id)
+        .execution_options(populate_existing=True)
+    )
+    return list(result)
+
+
+@router.post("/apply/", response_model=schemas.Application)
+async def apply_for_job(application: schemas.ApplicationCreate, user_id: int, db: AsyncSession = Depends(get_async_db)):
+    user = await db.get(models.User, user_id)
+    job = await db.get(models.Job, application.job_id)
+    if not user or not job:
+        raise HTTPException(status_code=404, detail="User or Job not found")
+
+    # Generate (or reuse a previous attempt's) email and send it, or fall back to manual apply
+    status, email_content, content_key = await apply_queue.apply_to_job_async(db, user, job)
+
+    new_application = models.Application(
+        user_id=user.id,
+        job_id=job.id,
+        status=status,
+        generated_email_content=email_content,
+        content_key=content_key
+    )
+    db.add(new_application)
+    if status == "email_sent":
+        await db.run_sync(seen_jobs.record, user.id, [job.id], seen_jobs.APPLIED)
+    await db.commit()
+
+    (new_application,) = await _with_jobs(db, [new_application.id])
+    return new_application
+
+
+@router.post("/apply/batch", response_model=List[schemas.Application], status_code=202)
+async def apply_for_jobs(batch: schemas.BatchApplicationCreate, user_id: int, db: AsyncSession = Depends(get_async_db)):
+    if not await db.get(models.User, user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+
+    job_ids = list(dict.fromkeys(batch.job_ids))
+    found_ids = set(await db.scalars(select(models.Job.id).where(models.Job.id.in_(job_ids))))
+    missing = [job_id for job_id in job_ids if job_id not in found_ids]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Jobs not found: {missing}")
+
+    # Record every application as queued up front; workers fill in the outcome
+    queued = [models.Application(user_id=user_id, job_id=job_id, status="queued") for job_id in job_ids]
+    db.add_all(queued)
+    await db.commit()
+
+    queued = await _with_jobs(db, [application.id for application in queued])
+    apply_queue.enqueue([application.id for application in queued])
+
+    return queued
+
+
+@router.get("/applications/{user_id}", response_model=List[schemas.ApplicationSummary])
+async def get_applications(
+    user_id: int,
+    request: Request,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Newest applications first, one keyset page at a time.
+    Pass the X-Next-Cursor response header back as ?cursor= for the next page.
+    """
+    rows = (await db.execute(_page_statement(user_id, status, cursor, limit, db.get_bind().dialect.name))).all()
+    return _page_response(request, rows, limit)
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from ... import models, schemas
+from ...conditional import dump_json, json_response
+from ...database import AsyncSessionLocal, get_async_db
+from ...services import providers, search_index, seen_jobs
+from ..jobs import _jobs_event, _mark_seen, _profile, _resolve_filters, _select_jobs
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"]
+)
+
+
+async def _build_filters(
+    db: AsyncSession, query: str, location: str, user_id: Optional[int]
+) -> Tuple[Dict, Optional[Dict]]:
+    user = await db.get(models.User, user_id) if user_id else None
+    user_details = _profile(user) if user else None
+    # End the read transaction: no pooled connection is held while Gemini and providers are awaited
+    await db.commit()
+    # Gemini filter generation is a blocking call (usually a cache hit)
+    filters = await asyncio.to_thread(_resolve_filters, user_details, query, location)
+    return filters, user_details
+
+
+def _store_batch(db, fetched_jobs, user_id, user_details, include_seen, returned_ids) -> List[models.Job]:
+    # Runs through AsyncSession.run_sync, so the shared sync helpers do the work
+    batch = _select_jobs(db, fetched_jobs, user_id, user_details, include_seen, returned_ids)
+    _mark_seen(db, user_id, batch)
+    # Release the connection before the next provider batch is awaited
+    db.commit()
+    return batch
+
+
+@router.get("/search", response_model=List[schemas.JobListItem])
+async def search_jobs(
+    query: str = "",
+    location: str = "remote",
+    user_id: Optional[int] = None,
+    max_results: int = Query(30, ge=1, le=300),
+    include_seen: bool = False,
+    db: AsyncSession = Depends(get_async_db)
+):
+    filters, user_details = await _build_filters(db, query, location, user_id)
+    user_id = user_id if user_details else None
+
+    # Providers run on the shared pool; this request holds no thread while it waits
+    all_fetched_jobs = await providers.search_all_async(filters, max_results=max_results)
+
+    jobs_to_return = await db.run_sync(_store_batch, all_fetched_jobs, user_id, user_details, include_seen, set())
+    return Response(dump_json(List[schemas.JobListItem], jobs_to_return), media_type="application/json")
+
+
+@router.get("/search/stream")
+async def stream_search_jobs(
+    query: str = "",
+    location: str = "remote",
+    user_id: Optional[int] = None,
+    max_results: int = Query(30, ge=1, le=300),
+    include_seen: bool = False
+):
+    """
+    Same search as /jobs/search, streamed as newline-delimited JSON.
+    Emits one {"event": "jobs"} line per provider as soon as its batch is stored,
+    then a final {"event": "summary"} line.
+    """
+    async def events():
+        started = time.monotonic()
+        # The response outlives the request's dependencies, so it owns its session
+        async with AsyncSessionLocal() as db:
+            filters, user_details = await _build_filters(db, query, location, user_id)
+            seen_user_id = user_id if user_details else None
+            returned_ids = set()
+            counts = {}
+
+            async for provider, fetched_jobs, error in providers.aiter_provider_results(filters, max_results=max_results):
+                if error:
+                    yield json.dumps({"event": "error", "provider": provider, "detail": error}) + "\n"
+                    continue
+                try:
+                    batch = await db.run_sync(
+                        _store_batch, fetched_jobs, seen_user_id, user_details, include_seen, returned_ids
+                    )
+                except HTTPException as e:
+                    yield json.dumps({"event": "error", "provider": provider, "detail": e.detail}) + "\n"
+                    continue
+                counts[provider] = len(batch)
+                yield _jobs_event(provider, batch)
+
+            yield json.dumps({
+                "event": "summary",
+                "total": len(returned_ids),
+                "providers": counts,
+                "elapsed_ms": round((time.monotonic() - started) * 1000),
+            }) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@router.get("/local-search", response_model=List[schemas.JobListItem])
+async def local_search_jobs(
+    request: Request,
+    q: str,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_async_db)
+):
+    # Ranked full-text search over jobs already stored; no provider calls
+    jobs = await db.run_sync(search_index.search, q, limit=limit, offset=offset)
+    return json_response(request, dump_json(List[schemas.JobListItem], jobs))
+
+
+# Declared after the fixed /jobs/... paths so those are matched first
+@router.get("/{job_id}", response_model=schemas.Job)
+async def get_job(job_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    job = await db.get(models.Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return json_response(request, dump_json(schemas.Job, job))
+
+
+@router.post("/{job_id}/dismiss", status_code=204)
+async def dismiss_job(job_id: int, user_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Hide a job from the user's future searches.
+    """
+    if not await db.get(models.User, user_id) or not await db.get(models.Job, job_id):
+        raise HTTPException(status_code=404, detail="User or Job not found")
+
+    await db.run_sync(seen_jobs.record, user_id, [job_id], seen_jobs.DISMISSED)
+    await db.commit()
+    return Response(status_code=204)
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ... import models, schemas
+from ...conditional import dump_json, json_response
+from ...database import get_async_db
+
+router = APIRouter(
+    prefix="/users",
+    tags=["users"]
+)
+
+@router.post("/", response_model=schemas.User)
+async def create_user(user: schemas.UserCreate, db: AsyncSession = Depends(get_async_db)):
+    db_user = await db.scalar(select(models.User).where(models.User.email == user.email))
+    if db_user:
+        raise HTTPException(status_code=400, detail="Email already registered")
+
+    new_user = models.User(**user.model_dump())
+    db.add(new_user)
+    await db.commit()
+    await db.refresh(new_user)
+    return new_user
+
+@router.get("/{email}", response_model=schemas.User)
+async def get_user(email: str, request: Request, db: AsyncSession = Depends(get_async_db)):
+    db_user = await db.scalar(select(models.User).where(models.User.email == email))
+    if not db_user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return json_response(request, dump_json(schemas.User, db_user))
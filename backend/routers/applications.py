@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import String, and_, or_, select, type_coerce
+from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional
+import base64
+import binascii
+import json
+from datetime import datetime
 from .. import models, schemas
+from ..conditional import dump_json, json_response
 from ..database import get_db
-from ..services import email_agent, email
+from ..services import apply_queue, seen_jobs
 
 router = APIRouter(
     tags=["applications"]
@@ -18,47 +24,114 @@ def apply_for_job(application: schemas.ApplicationCreate, user_id: int, db: Sess
     if not user or not job:
         raise HTTPException(status_code=404, detail="User or Job not found")
 
-    # 2. Check for HR Email
-    if job.hr_email:
-        # Generate Email Content via Agent
-        user_details = {
-            "name": user.name,
-            "email": user.email,
-            "phone_number": user.phone_number,
-            "skills": user.skills,
-            "experience": user.experience,
-            "linkedin_url": user.linkedin_url
-        }
-        job_details = {
-            "title": job.title,
-            "company": job.company,
-            "description": job.description
-        }
-        
-        email_content = email_agent.generate_email_content(user_details, job_details)
-        
-        # Send Email
-        
-        email_sent = email.send_email(job.hr_email, f"Application for {job.title}", email_content, attachment_path=None)
-        status = "email_sent" if email_sent else "failed"
-    else:
-        # Handle cases where no HR email is found
-        email_content = f"No HR email found. Please apply manually at {job.url}"
-        status = "manual_apply_required"
+    # 2. Generate (or reuse a previous attempt's) email and send it, or fall back to manual apply
+    status, email_content, content_key = apply_queue.apply_to_job(db, user, job)
 
-    # 4. Create Application Record
+    # 3. Create Application Record
     new_application = models.Application(
         user_id=user.id,
         job_id=job.id,
         status=status,
-        generated_email_content=email_content
+        generated_email_content=email_content,
+        content_key=content_key
     )
     db.add(new_application)
+    if status == "email_sent":
+        seen_jobs.record(db, user.id, [job.id], seen_jobs.APPLIED)
     db.commit()
     db.refresh(new_application)
     
     return new_application
 
-@router.get("/applications/{user_id}", response_model=List[schemas.Application])
-def get_applications(user_id: int, db: Session = Depends(get_db)):
-    return db.query(models.Application).filter(models.Application.user_id == user_id).all()
+@router.post("/apply/batch", response_model=List[schemas.Application], status_code=202)
+def apply_for_jobs(batch: schemas.BatchApplicationCreate, user_id: int, db: Session = Depends(get_db)):
+    user = db.query(models.User).filter(models.User.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    job_ids = list(dict.fromkeys(batch.job_ids))
+    found_ids = {job_id for (job_id,) in db.query(models.Job.id).filter(models.Job.id.in_(job_ids))}
+    missing = [job_id for job_id in job_ids if job_id not in found_ids]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Jobs not found: {missing}")
+
+    # Record every application as queued up front; workers fill in the outcome
+    queued = [models.Application(user_id=user.id, job_id=job_id, status="queued") for job_id in job_ids]
+    db.add_all(queued)
+    db.commit()
+    for application in queued:
+        db.refresh(application)
+
+    apply_queue.enqueue([application.id for application in queued])
+
+    return queued
+
+def _encode_cursor(applied_at, application_id: int) -> str:
+    applied_at = applied_at.isoformat() if isinstance(applied_at, datetime) else str(applied_at)
+    return base64.urlsafe_b64encode(json.dumps([applied_at, application_id]).encode()).decode()
+
+def _decode_cursor(cursor: str):
+    try:
+        applied_at, application_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(applied_at), int(application_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _page_statement(user_id: int, status: Optional[str], cursor: Optional[str], limit: int, dialect: str):
+    """
+    One keyset page of (application, applied_at cursor value) rows, plus one extra row
+    that tells whether there is a next page.
+    """
+    if dialect == "sqlite":
+        # SQLite stores timestamps as text: compare them as stored, so the cursor round-trips exactly
+        applied_at = type_coerce(models.Application.applied_at, String).label("applied_at_raw")
+    else:
+        # Real timestamp columns compare against a datetime; the cursor carries it as ISO 8601
+        applied_at = models.Application.applied_at.label("applied_at_raw")
+
+    statement = select(models.Application, applied_at).options(
+        joinedload(models.Application.job)
+    ).where(models.Application.user_id == user_id)
+
+    if status:
+        statement = statement.where(models.Application.status == status)
+
+    if cursor:
+        cursor_applied_at, cursor_id = _decode_cursor(cursor)
+        if dialect != "sqlite":
+            try:
+                cursor_applied_at = datetime.fromisoformat(cursor_applied_at)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        statement = statement.where(or_(
+            applied_at < cursor_applied_at,
+            and_(applied_at == cursor_applied_at, models.Application.id < cursor_id),
+        ))
+
+    return statement.order_by(models.Application.applied_at.desc(), models.Application.id.desc()).limit(limit + 1)
+
+def _page_response(request: Request, rows, limit: int) -> Response:
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_application, last_applied_at = rows[-1]
+        headers["X-Next-Cursor"] = _encode_cursor(last_applied_at, last_application.id)
+
+    body = dump_json(List[schemas.ApplicationSummary], [application for application, _ in rows])
+    return json_response(request, body, headers)
+
+@router.get("/applications/{user_id}", response_model=List[schemas.ApplicationSummary])
+def get_applications(
+    user_id: int,
+    request: Request,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db)
+):
+    """
+    Newest applications first, one keyset page at a time.
+    Pass the X-Next-Cursor response header back as ?cursor= for the next page.
+    """
+    rows = db.execute(_page_statement(user_id, status, cursor, limit, db.get_bind().dialect.name)).all()
+    return _page_response(request, rows, limit)
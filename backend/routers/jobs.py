@@ -1,101 +1,226 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+import json
+import time
 from .. import models, schemas
-from ..database import get_db
-from ..services import linkedin, job_filter_agent, active_jobs, jsearch
+from ..conditional import dump_json, json_response
+from ..database import get_db, SessionLocal
+from ..services import job_filter_agent, providers, job_store, dedup, search_index, ranking, seen_jobs
+from ..services.job_record import JobRecord
 
 router = APIRouter(
     prefix="/jobs",
     tags=["jobs"]
 )
 
-@router.get("/search", response_model=List[schemas.Job])
-def search_jobs(query: str = "", location: str = "remote", user_id: Optional[int] = None, db: Session = Depends(get_db)):
-    
-    filters = {}
-    
-    if user_id:
-        user = db.query(models.User).filter(models.User.id == user_id).first()
-        if user:
-            user_details = {
-                "skills": user.skills,
-                "experience": user.experience,
-                "location": user.location
-            }
-            filters = job_filter_agent.generate_search_filters(user_details, query)
 
+def _profile(user: models.User) -> Dict:
+    return {
+        "skills": user.skills,
+        "experience": user.experience,
+        "location": user.location
+    }
+
+
+def _resolve_filters(user_details: Optional[Dict], query: str, location: str) -> Dict:
+    filters = job_filter_agent.generate_search_filters(user_details, query) if user_details else {}
 
     if not filters:
         if not query:
             filters = {"title_filter": "Software Engineer"}
         else:
             filters = {"title_filter": query}
-    
+
     if location and "location_filter" not in filters:
          filters["location_filter"] = location
 
-    rapid_jobs = []
-    try:
-        rapid_jobs = linkedin.search_jobs(filters)
-    except Exception as e:
-        pass
-        
-    active_db_jobs = []
-    try:
-        active_db_jobs = active_jobs.search_jobs(filters)
-    except Exception as e:
-        pass
-
-    jsearch_jobs = []
-    try:
-        jsearch_jobs = jsearch.search_jobs(filters)
-    except Exception as e:
-        pass
+    return filters
 
-    all_fetched_jobs = rapid_jobs + active_db_jobs + jsearch_jobs
-    
-    if not all_fetched_jobs:
-         # Only raise if BOTH failed or returned nothing
-         pass
 
+def _build_filters(db: Session, query: str, location: str, user_id: Optional[int]) -> Tuple[Dict, Optional[Dict]]:
+    """
+    Resolve provider filters for a search, plus the user's profile details when known.
+    """
+    user_details = None
 
-    jobs_to_return = []
-    
-    applied_job_ids = set()
     if user_id:
-        applied_jobs = db.query(models.Application).filter(
-            models.Application.user_id == user_id,
-            models.Application.status == "email_sent"
-        ).all()
-        applied_job_ids = {app.job_id for app in applied_jobs}
+        user = db.query(models.User).filter(models.User.id == user_id).first()
+        if user:
+            user_details = _profile(user)
+
+    return _resolve_filters(user_details, query, location), user_details
+
 
+def _user_jobs(db: Session, user_id: Optional[int]) -> Optional[seen_jobs.UserJobs]:
+    # Only known users have job states; user_id is None when the lookup found no one
+    return seen_jobs.for_user(db, user_id) if user_id else None
+
+
+def _store_jobs(
+    db: Session, fetched_jobs: List[JobRecord], user_jobs: Optional[seen_jobs.UserJobs],
+    include_seen: bool, returned_ids: Set[int]
+) -> List[models.Job]:
+    """
+    Persist a batch of provider jobs and return the canonical jobs the user has not
+    applied to, dismissed or (unless include_seen) seen before, and that were not
+    already returned (returned_ids is updated in place).
+    """
     try:
-        for r_job in all_fetched_jobs:
-            # Check if exists
-            db_job = db.query(models.Job).filter(models.Job.rapidapi_id == r_job['job_id']).first()
-            if not db_job:
-                db_job = models.Job(
-                    rapidapi_id=r_job['job_id'],
-                    title=r_job['job_title'],
-                    company=r_job['company_name'],
-                    location=r_job['location'],
-                    description=r_job['job_description'],
-                    hr_email=r_job.get('hr_email'),
-                    url=r_job['linkedin_job_url_cleaned'],
-                    posted_at=datetime.utcnow()
-                )
-                db.add(db_job)
-                db.commit()
-                db.refresh(db_job)
-            
-            if db_job.id in applied_job_ids:
-                continue
-
-            jobs_to_return.append(db_job)
+        stored_jobs = job_store.upsert_jobs(db, fetched_jobs)
+        # The same posting from several providers collapses to its canonical job
+        stored_jobs = dedup.canonical_jobs(db, stored_jobs)
     except Exception as e:
-
+        db.rollback()
         raise HTTPException(status_code=500, detail=f"Error saving jobs: {str(e)}")
-    
+
+    jobs_to_return = []
+    for db_job in stored_jobs:
+        if db_job.id in returned_ids or (user_jobs is not None and user_jobs.excludes(db_job.id, include_seen)):
+            continue
+
+        returned_ids.add(db_job.id)
+        jobs_to_return.append(db_job)
     return jobs_to_return
+
+
+def _select_jobs(
+    db: Session, fetched_jobs: List[JobRecord], user_id: Optional[int], user_details: Optional[Dict],
+    include_seen: bool, returned_ids: Set[int]
+) -> List[models.Job]:
+    """
+    Store a batch of provider jobs and return the ones to show, best matches first.
+    """
+    jobs = _store_jobs(db, fetched_jobs, _user_jobs(db, user_id), include_seen, returned_ids)
+    if user_details:
+        # Best matches for the user's skills and experience first
+        jobs = ranking.rank_jobs(user_details, jobs)
+    return jobs
+
+
+def _mark_seen(db: Session, user_id: Optional[int], jobs: List[models.Job]):
+    # Jobs shown once don't come back in later searches unless include_seen is set
+    if user_id and jobs:
+        seen_jobs.record(db, user_id, (job.id for job in jobs), seen_jobs.SEEN)
+        db.commit()
+
+
+def _jobs_event(provider: str, batch: List[models.Job]) -> str:
+    return json.dumps({
+        "event": "jobs",
+        "provider": provider,
+        "jobs": [schemas.JobListItem.model_validate(job, from_attributes=True).model_dump(mode="json") for job in batch],
+    }) + "\n"
+
+
+@router.get("/search", response_model=List[schemas.JobListItem])
+def search_jobs(
+    query: str = "",
+    location: str = "remote",
+    user_id: Optional[int] = None,
+    max_results: int = Query(30, ge=1, le=300),
+    include_seen: bool = False,
+    db: Session = Depends(get_db)
+):
+    filters, user_details = _build_filters(db, query, location, user_id)
+    user_id = user_id if user_details else None
+
+    # Query all providers concurrently; a slow or failing one is skipped
+    all_fetched_jobs = providers.search_all(filters, max_results=max_results)
+
+    jobs_to_return = _select_jobs(db, all_fetched_jobs, user_id, user_details, include_seen, set())
+
+    # Serialize first: the commit in _mark_seen expires the loaded rows
+    body = dump_json(List[schemas.JobListItem], jobs_to_return)
+    _mark_seen(db, user_id, jobs_to_return)
+
+    # Cards only need the summary; full descriptions come from /jobs/{id}
+    return Response(body, media_type="application/json")
+
+
+@router.get("/search/stream")
+def stream_search_jobs(
+    query: str = "",
+    location: str = "remote",
+    user_id: Optional[int] = None,
+    max_results: int = Query(30, ge=1, le=300),
+    include_seen: bool = False
+):
+    """
+    Same search as /jobs/search, streamed as newline-delimited JSON.
+    Emits one {"event": "jobs"} line per provider as soon as its batch is stored,
+    then a final {"event": "summary"} line.
+    """
+    def events():
+        started = time.monotonic()
+        # The response outlives the request's dependencies, so it owns its session
+        db = SessionLocal()
+        try:
+            filters, user_details = _build_filters(db, query, location, user_id)
+            seen_user_id = user_id if user_details else None
+            returned_ids = set()
+            counts = {}
+
+            for provider, fetched_jobs, error in providers.iter_provider_results(filters, max_results=max_results):
+                if error:
+                    yield json.dumps({"event": "error", "provider": provider, "detail": error}) + "\n"
+                    continue
+                try:
+                    batch = _select_jobs(db, fetched_jobs, seen_user_id, user_details, include_seen, returned_ids)
+                except HTTPException as e:
+                    yield json.dumps({"event": "error", "provider": provider, "detail": e.detail}) + "\n"
+                    continue
+                counts[provider] = len(batch)
+                line = _jobs_event(provider, batch)
+                # After serializing, since the commit expires the batch's rows
+                _mark_seen(db, seen_user_id, batch)
+                yield line
+
+            yield json.dumps({
+                "event": "summary",
+                "total": len(returned_ids),
+                "providers": counts,
+                "elapsed_ms": round((time.monotonic() - started) * 1000),
+            }) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@router.get("/local-search", response_model=List[schemas.JobListItem])
+def local_search_jobs(
+    request: Request,
+    q: str,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    # Ranked full-text search over jobs already stored; no provider calls
+    jobs = search_index.search(db, q, limit=limit, offset=offset)
+    return json_response(request, dump_json(List[schemas.JobListItem], jobs))
+
+
+# Declared after the fixed /jobs/... paths so those are matched first
+@router.get("/{job_id}", response_model=schemas.Job)
+def get_job(job_id: int, request: Request, db: Session = Depends(get_db)):
+    job = db.query(models.Job).filter(models.Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return json_response(request, dump_json(schemas.Job, job))
+
+
+@router.post("/{job_id}/dismiss", status_code=204)
+def dismiss_job(job_id: int, user_id: int, db: Session = Depends(get_db)):
+    """
+    Hide a job from the user's future searches.
+    """
+    user_exists = db.query(models.User.id).filter(models.User.id == user_id).first()
+    job_exists = db.query(models.Job.id).filter(models.Job.id == job_id).first()
+    if not user_exists or not job_exists:
+        raise HTTPException(status_code=404, detail="User or Job not found")
+
+    seen_jobs.record(db, user_id, [job_id], seen_jobs.DISMISSED)
+    db.commit()
+    return Response(status_code=204)
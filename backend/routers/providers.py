@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from ..services import cache, providers
+
+router = APIRouter(
+    prefix="/providers",
+    tags=["providers"]
+)
+
+@router.get("/cache")
+def get_cache_stats():
+    return cache.all_stats()
+
+
+@router.get("/status")
+def get_provider_status():
+    return providers.status()
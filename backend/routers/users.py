@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from .. import models, schemas
+from ..conditional import dump_json, json_response
 from ..database import get_db
 
 router = APIRouter(
@@ -27,8 +28,8 @@ def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
 
 @router.get("/{email}", response_model=schemas.User)
-def get_user(email: str, db: Session = Depends(get_db)):
+def get_user(email: str, request: Request, db: Session = Depends(get_db)):
     db_user = db.query(models.User).filter(models.User.email == email).first()
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
-    return db_user
+    return json_response(request, dump_json(schemas.User, db_user))
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from typing import List, Optional, Any
 from datetime import datetime
 
@@ -55,6 +55,36 @@ class Job(JobBase):
     class Config:
         orm_mode = True
 
+class JobSummary(BaseModel):
+    # Job fields needed to list it, without the multi-kilobyte description
+    id: int
+    title: Optional[str] = ""
+    company: Optional[str] = ""
+    location: Optional[str] = ""
+    hr_email: Optional[str] = None
+    url: Optional[str] = "#"
+
+    class Config:
+        orm_mode = True
+
+# Description length in job list payloads; the full text is served by /jobs/{id}
+LIST_DESCRIPTION_CHARS = 300
+
+class JobListItem(JobSummary):
+    # What a job card shows: the core fields and the start of the description
+    rapidapi_id: str
+    description: Optional[str] = ""
+    posted_at: Optional[datetime] = None
+
+    @field_validator('description', mode='before')
+    @classmethod
+    def truncate_description(cls, v: Any) -> str:
+        text = "" if v is None else str(v)
+        if len(text) <= LIST_DESCRIPTION_CHARS:
+            return text
+        # Cut at a word boundary so the card never ends mid-word
+        return text[:LIST_DESCRIPTION_CHARS].rsplit(" ", 1)[0].rstrip() + "…"
+
 # Application Schemas
 class ApplicationBase(BaseModel):
     job_id: int
@@ -62,6 +92,9 @@ class ApplicationBase(BaseModel):
 class ApplicationCreate(ApplicationBase):
     pass
 
+class BatchApplicationCreate(BaseModel):
+    job_ids: List[int] = Field(..., min_length=1, max_length=200)
+
 class Application(ApplicationBase):
     id: int
     user_id: int
@@ -72,3 +105,14 @@ class Application(ApplicationBase):
 
     class Config:
         orm_mode = True
+
+class ApplicationSummary(ApplicationBase):
+    id: int
+    user_id: int
+    status: str
+    generated_email_content: Optional[str] = None
+    applied_at: datetime
+    job: JobSummary
+
+    class Config:
+        orm_mode = True
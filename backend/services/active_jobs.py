@@ -1,24 +1,46 @@
-import requests
+import logging
 import os
-from typing import List, Dict
-from .utils import extract_email
+from typing import List, Dict, Optional, Tuple
+from . import provider_http, resilience
+from .job_record import JobRecord, make_record, read_page
+from .pagination import DEFAULT_MAX_RESULTS, collect_pages, page_count
+
+logger = logging.getLogger(__name__)
 
 # Specific credentials for Active Jobs DB
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY", "8b25aa6a19msh5f1231629a205a7p16e368jsn458fa3565a76")
 RAPIDAPI_HOST = os.getenv("RAPIDAPI_HOST_ACTIVE_JOBS_DB", "active-jobs-db.p.rapidapi.com")
+PAGE_SIZE = int(os.getenv("ACTIVE_JOBS_PAGE_SIZE", "10"))
+
+# Token bucket sized to this host's RapidAPI plan (ACTIVE_JOBS_RATE_PER_MINUTE / ACTIVE_JOBS_RATE_BURST)
+resilience.configure_host(RAPIDAPI_HOST, "ACTIVE_JOBS")
+
 
+def _normalize(item: Dict) -> Optional[JobRecord]:
+    record = make_record(
+        job_id=item.get("id") or item.get("job_id"),
+        job_title=item.get("title") or item.get("job_title"),
+        company_name=item.get("company_name") or item.get("organization"),
+        location=item.get("location"),
+        description=item.get("description") or item.get("job_description"),
+        url=item.get("url"),
+        posted_at=item.get("date_posted") or item.get("posted_date"),
+    )
+    # Only keep postings with minimal info present
+    if record.job_title and record.company_name:
+        return record
+    return None
 
 
-def search_jobs(filters: Dict) -> List[Dict]:
+def search_jobs(filters: Dict, max_results: int = DEFAULT_MAX_RESULTS) -> List[JobRecord]:
     """
     Search for jobs using Active Jobs DB RapidAPI.
+    Fetches enough limit/offset pages concurrently to reach max_results.
     """
     url = f"https://{RAPIDAPI_HOST}/active-ats-24h"
-    
+
     # Defaults
     querystring = {
-        "limit": "10",
-        "offset": "0",
         "description_type": "text"
     }
 
@@ -26,7 +48,7 @@ def search_jobs(filters: Dict) -> List[Dict]:
     # The agent provides: title_filter, location_filter, which match exactly.
     if filters:
         querystring.update(filters)
-        
+
         # Ensure correct type for API (sometimes APIs are picky about boolean strings)
         if querystring.get("remote") == "true":
              pass # valid
@@ -38,46 +60,18 @@ def search_jobs(filters: Dict) -> List[Dict]:
         "x-rapidapi-host": RAPIDAPI_HOST
     }
 
-    print(f"DEBUG: Active Jobs DB Params: {querystring}")
-
-    try:
-        response = requests.get(url, headers=headers, params=querystring)
-        print(f"DEBUG: Active Jobs DB Status: {response.status_code}")
-        response.raise_for_status()
-        
-        data = response.json()
-        # active-jobs-db active-ats-7d returns a list directly or data object?
-        # Based on user input example "active-ats-7d", usually returns list or paginated.
-        # Let's assume list or key 'data' similar to others. 
-        # Actually user didn't show response format, assuming standard list or single key.
-        # Safe approach: check type.
-        
-        jobs_list = data if isinstance(data, list) else data.get('data', [])
-        
-        normalized_jobs = []
-        for item in jobs_list:
-            description = item.get("description") or item.get("job_description") or ""
-            hr_email = extract_email(description)
+    logger.debug("Active Jobs DB params=%s", querystring)
 
-            job_obj = {
-                "job_id": str(item.get("id") or item.get("job_id") or ""),
-                "job_title": item.get("title") or item.get("job_title") or "",
-                "company_name": item.get("company_name") or item.get("organization") or "",
-                "location": item.get("location") or "",
-                "description": description or "No description",
-                "job_description": description or "No description", # Alias for main.py compatibility
-                "hr_email": hr_email,
-                "url": item.get("url") or "#",
-                "linkedin_job_url_cleaned": item.get("url") or "#", # Alias for main.py compatibility
-                "posted_at": item.get("date_posted") or item.get("posted_date")
-            }
-            # Only add if minimal info is present
-            if job_obj["job_title"] and job_obj["company_name"]:
-                 normalized_jobs.append(job_obj)
-                 
-        print(f"DEBUG: Active Jobs DB found {len(normalized_jobs)} jobs")
-        return normalized_jobs
+    def fetch_page(index: int) -> Tuple[int, List[JobRecord]]:
+        params = dict(querystring, limit=str(PAGE_SIZE), offset=str(index * PAGE_SIZE))
+        with provider_http.get(url, headers=headers, params=params, stream=True) as response:
+            logger.debug("Active Jobs DB page=%d status=%d", index, response.status_code)
+            response.raise_for_status()
+            # active-ats returns a list directly or the list under 'data'; parsed as it streams
+            return read_page(response, _normalize)
 
-    except Exception as e:
-        print(f"ERROR in active_jobs.search_jobs: {e}")
-        return []
+    # A first-page error propagates so the caller skips this provider; later pages degrade to a partial result
+    normalized_jobs = collect_pages(fetch_page, page_count(max_results, PAGE_SIZE), PAGE_SIZE, "Active Jobs DB")
+    normalized_jobs = normalized_jobs[:max_results]
+    logger.debug("Active Jobs DB returned %d jobs", len(normalized_jobs))
+    return normalized_jobs
@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, joinedload
+from .. import models
+from ..database import SessionLocal
+from . import email_agent, email, seen_jobs
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent batches; Gemini calls are further bounded by GEMINI_CONCURRENCY
+APPLY_WORKERS = int(os.getenv("APPLY_WORKERS", "4"))
+# Applications handled per worker task: generated together, sent over one SMTP session
+APPLY_BATCH_SIZE = int(os.getenv("APPLY_BATCH_SIZE", "10"))
+# A "processing" row claimed longer ago than this belongs to a worker that died mid-batch
+APPLY_STALE_AFTER = float(os.getenv("APPLY_STALE_AFTER", "900"))
+
+_executor = ThreadPoolExecutor(max_workers=APPLY_WORKERS, thread_name_prefix="apply")
+
+
+def _details(user: models.User, job: models.Job) -> Tuple[Dict, Dict]:
+    user_details = {
+        "name": user.name,
+        "email": user.email,
+        "phone_number": user.phone_number,
+        "skills": user.skills,
+        "experience": user.experience,
+        "linkedin_url": user.linkedin_url
+    }
+    job_details = {
+        "title": job.title,
+        "company": job.company,
+        "description": job.description
+    }
+    return user_details, job_details
+
+
+def _manual_apply_note(job: models.Job) -> str:
+    return f"No HR email found. Please apply manually at {job.url}"
+
+
+def cached_contents(db: Session, keys: Iterable[str]) -> Dict[str, str]:
+    """
+    Previously generated emails for these content keys, e.g. from an attempt whose
+    send failed. Reusing them means retries and resends make no Gemini call.
+    """
+    keys = list(set(keys))
+    if not keys:
+        return {}
+    rows = db.query(models.Application.content_key, models.Application.generated_email_content).filter(
+        models.Application.content_key.in_(keys),
+        models.Application.generated_email_content.isnot(None)
+    )
+    return {key: content for key, content in rows}
+
+
+def apply_to_job(db: Session, user: models.User, job: models.Job) -> Tuple[str, str, Optional[str]]:
+    """
+    Generate (or reuse) and send the cold email for one job.
+    Returns (status, email_content, content_key) for the Application record.
+    """
+    if not job.hr_email:
+        # Handle cases where no HR email is found
+        return "manual_apply_required", _manual_apply_note(job), None
+
+    user_details, job_details = _details(user, job)
+    key = email_agent.content_key(user_details, job_details)
+
+    email_content = cached_contents(db, [key]).get(key)
+    if email_content is None:
+        email_content = email_agent.generate_email_content(user_details, job_details)
+
+    email_sent = email.send_email(job.hr_email, f"Application for {job.title}", email_content, attachment_path=None)
+    return ("email_sent" if email_sent else "failed"), email_content, key
+
+
+async def apply_to_job_async(db, user: models.User, job: models.Job) -> Tuple[str, str, Optional[str]]:
+    """
+    apply_to_job for an AsyncSession: the email cache lookup goes through the session,
+    generation is awaited on the Gemini loop and the blocking SMTP send runs on a worker thread.
+    """
+    if not job.hr_email:
+        return "manual_apply_required", _manual_apply_note(job), None
+
+    user_details, job_details = _details(user, job)
+    key = email_agent.content_key(user_details, job_details)
+
+    email_content = (await db.run_sync(cached_contents, [key])).get(key)
+    # End the read transaction so no pooled connection is held during the slow calls
+    await db.commit()
+    if email_content is None:
+        email_content = await email_agent.generate_email_content_async(user_details, job_details)
+
+    email_sent = await asyncio.to_thread(
+        email.send_email, job.hr_email, f"Application for {job.title}", email_content, None
+    )
+    return ("email_sent" if email_sent else "failed"), email_content, key
+
+
+def process_batch(application_ids: List[int]):
+    """
+    Worker entry point: run a batch of queued applications and record their final status.
+    Missing emails are generated concurrently, then all are sent over one SMTP session.
+    """
+    db = SessionLocal()
+    try:
+        # Claim each row atomically so two workers never send the same email
+        claimed_at = datetime.utcnow()
+        claimed_ids = [
+            application_id for application_id in application_ids
+            if db.query(models.Application).filter(
+                models.Application.id == application_id,
+                models.Application.status == "queued"
+            ).update({"status": "processing", "claimed_at": claimed_at}, synchronize_session=False)
+        ]
+        db.commit()
+        if not claimed_ids:
+            return
+
+        applications = db.query(models.Application).options(
+            joinedload(models.Application.user), joinedload(models.Application.job)
+        ).filter(models.Application.id.in_(claimed_ids)).all()
+
+        to_send = []
+        for application in applications:
+            if not application.job.hr_email:
+                application.status = "manual_apply_required"
+                application.generated_email_content = _manual_apply_note(application.job)
+                continue
+            user_details, job_details = _details(application.user, application.job)
+            application.content_key = email_agent.content_key(user_details, job_details)
+            to_send.append((application, user_details, job_details))
+
+        contents = cached_contents(db, (application.content_key for application, _, _ in to_send))
+        pending = {}
+        for application, user_details, job_details in to_send:
+            if application.content_key not in contents:
+                pending.setdefault(application.content_key, (user_details, job_details))
+        if pending:
+            try:
+                generated = email_agent.generate_many(list(pending.values()))
+            except Exception as e:
+                logger.error("Generating emails failed for applications=%s: %s", claimed_ids, e)
+                generated = [e] * len(pending)
+            for key, content in zip(pending, generated):
+                if not isinstance(content, Exception):
+                    contents[key] = content
+
+        ready = [application for application, _, _ in to_send if application.content_key in contents]
+        for application, _, _ in to_send:
+            application.generated_email_content = contents.get(application.content_key)
+            application.status = "failed"
+
+        if ready:
+            sent = email.send_many([{
+                "to_email": application.job.hr_email,
+                "subject": f"Application for {application.job.title}",
+                "body": application.generated_email_content,
+                "attachment_path": None,
+            } for application in ready])
+            for application, email_sent in zip(ready, sent):
+                application.status = "email_sent" if email_sent else "failed"
+                if email_sent:
+                    seen_jobs.record(db, application.user_id, [application.job_id], seen_jobs.APPLIED)
+
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.exception("Processing applications=%s failed: %s", application_ids, e)
+        db.query(models.Application).filter(
+            models.Application.id.in_(application_ids),
+            models.Application.status == "processing"
+        ).update({"status": "failed"}, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def enqueue(application_ids: Iterable[int]):
+    application_ids = list(application_ids)
+    for start in range(0, len(application_ids), APPLY_BATCH_SIZE):
+        _executor.submit(process_batch, application_ids[start:start + APPLY_BATCH_SIZE])
+
+
+def resume_pending():
+    """
+    Re-enqueue applications a previous process accepted but never started.
+    Rows left "processing" by a worker that died are marked failed, not re-sent:
+    the email may already have gone out. The user can apply again (the generated
+    email is reused).
+    """
+    db = SessionLocal()
+    try:
+        stale_before = datetime.utcnow() - timedelta(seconds=APPLY_STALE_AFTER)
+        stale = db.query(models.Application).filter(
+            models.Application.status == "processing",
+            or_(models.Application.claimed_at.is_(None), models.Application.claimed_at < stale_before)
+        ).update({"status": "failed"}, synchronize_session=False)
+        db.commit()
+        if stale:
+            logger.warning("Marked %d interrupted applications as failed", stale)
+
+        pending = db.query(models.Application.id).filter(models.Application.status == "queued").all()
+        enqueue([application_id for (application_id,) in pending])
+    finally:
+        db.close()
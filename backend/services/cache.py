@@ -0,0 +1,259 @@
+import dataclasses
+import functools
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Optional SQLite file shared by all uvicorn workers on the same host
+SHARED_CACHE_PATH = os.getenv("PROVIDER_CACHE_DB")
+DEFAULT_MAXSIZE = int(os.getenv("PROVIDER_CACHE_MAXSIZE", "256"))
+# Expired rows in the shared file are deleted once every this many writes (per process)
+SHARED_PURGE_EVERY = int(os.getenv("PROVIDER_CACHE_PURGE_EVERY", "100"))
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def _encode(value: Any) -> Any:
+    # Records such as JobRecord are stored as plain dicts in the shared tier
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return value.to_dict() if hasattr(value, "to_dict") else dataclasses.asdict(value)
+    return str(value)
+
+
+def canonical_key(filters: Optional[Dict]) -> str:
+    """
+    Canonicalize a filter dict so equivalent searches share one cache key.
+    Keys are sorted, strings are trimmed/lowercased with collapsed whitespace,
+    and empty values are dropped.
+    """
+    canonical = {}
+    for key, value in (filters or {}).items():
+        if isinstance(value, str):
+            value = " ".join(value.split()).lower()
+        elif isinstance(value, bool):
+            value = "true" if value else "false"
+        if value in ("", None):
+            continue
+        canonical[str(key)] = value
+    return json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class SQLiteStore:
+    """
+    Cross-process cache tier backed by a single SQLite file.
+    Expired rows are purged on open and every `purge_every` writes, so the file stays bounded.
+    """
+
+    def __init__(self, path: str, purge_every: int = SHARED_PURGE_EVERY):
+        self.path = path
+        self.purge_every = purge_every
+        self._writes = itertools.count(1)
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at ON cache_entries (expires_at)")
+        conn.commit()
+        self.purge_expired()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: str) -> Tuple[Any, float]:
+        row = self._connect().execute(
+            "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (namespace, key, time.time()),
+        ).fetchone()
+        if row is None:
+            return _MISSING, 0.0
+        return json.loads(row[0]), row[1]
+
+    def set(self, namespace: str, key: str, value: Any, expires_at: float):
+        self._connect().execute(
+            "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (namespace, key, json.dumps(value, default=_encode), expires_at),
+        )
+        if self.purge_every > 0 and next(self._writes) % self.purge_every == 0:
+            self.purge_expired()
+
+    def clear(self, namespace: str):
+        self._connect().execute("DELETE FROM cache_entries WHERE namespace = ?", (namespace,))
+
+    def purge_expired(self):
+        self._connect().execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with a per-cache TTL and optional shared SQLite tier.
+    `decode` rebuilds values read back from the shared tier (which stores JSON).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        maxsize: int = DEFAULT_MAXSIZE,
+        store: Optional[SQLiteStore] = None,
+        decode: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.store = store
+        self.decode = decode
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        if self.store is not None:
+            try:
+                value, expires_at = self.store.get(self.name, key)
+            except sqlite3.Error as e:
+                logger.warning("Shared cache read failed for %s: %s", self.name, e)
+                value = _MISSING
+            if value is not _MISSING:
+                if self.decode is not None:
+                    value = self.decode(value)
+                with self._lock:
+                    self.shared_hits += 1
+                    self._put(key, value, expires_at)
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def set(self, key: str, value: Any):
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._put(key, value, expires_at)
+        if self.store is not None:
+            try:
+                self.store.set(self.name, key, value, expires_at)
+            except sqlite3.Error as e:
+                logger.warning("Shared cache write failed for %s: %s", self.name, e)
+
+    def _put(self, key: str, value: Any, expires_at: float):
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            self.store.clear(self.name)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "ttl": self.ttl,
+                "maxsize": self.maxsize,
+                "size": len(self._entries),
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0,
+                "shared_tier": self.store is not None,
+            }
+
+
+_shared_store = None
+_registry: Dict[str, TTLCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_shared_store() -> Optional[SQLiteStore]:
+    global _shared_store
+    if SHARED_CACHE_PATH and _shared_store is None:
+        _shared_store = SQLiteStore(SHARED_CACHE_PATH)
+    return _shared_store
+
+
+def get_cache(
+    name: str,
+    ttl: float,
+    maxsize: int = DEFAULT_MAXSIZE,
+    shared: bool = True,
+    decode: Optional[Callable[[Any], Any]] = None,
+) -> TTLCache:
+    """
+    Return the named cache, creating and registering it on first use.
+    """
+    with _registry_lock:
+        if name not in _registry:
+            store = get_shared_store() if shared else None
+            _registry[name] = TTLCache(name, ttl, maxsize, store, decode)
+        return _registry[name]
+
+
+def all_stats() -> Dict[str, Dict]:
+    with _registry_lock:
+        caches = list(_registry.values())
+    return {c.name: c.stats() for c in caches}
+
+
+def cached_search(name: str, ttl: float, decode: Optional[Callable[[Any], Any]] = None) -> Callable:
+    """
+    Cache a provider's search_jobs(filters, ...) by the canonicalized filters
+    plus any extra arguments.
+    Empty results are not cached so a transient provider failure is retried.
+    """
+    def decorator(search: Callable) -> Callable:
+        result_cache = get_cache(name, ttl, decode=decode)
+
+        @functools.wraps(search)
+        def wrapper(filters: Dict, *args, **kwargs):
+            key = canonical_key(filters)
+            if args or kwargs:
+                # e.g. max_results: a different page budget is a different result
+                key += "|" + json.dumps([args, kwargs], sort_keys=True, default=str)
+            jobs = result_cache.get(key, _MISSING)
+            if jobs is not _MISSING:
+                return jobs
+            jobs = search(filters, *args, **kwargs)
+            if jobs:
+                result_cache.set(key, jobs)
+            return jobs
+
+        wrapper.cache = result_cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,247 @@
+import hashlib
+import os
+import random
+import re
+import zlib
+from array import array
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from sqlalchemy.orm import Session
+from .. import models
+
+# MinHash / LSH parameters: 16 bands x 4 rows puts the 50% candidate
+# probability at a Jaccard similarity of roughly (1/16) ** (1/4) = 0.5.
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+# The opening of a posting is what providers copy verbatim; cap the work per job
+MAX_WORDS = 1000
+
+# Estimated Jaccard similarity at which two postings from one company are the same job
+SIMILARITY_THRESHOLD = float(os.getenv("DEDUP_SIMILARITY_THRESHOLD", "0.8"))
+
+# Keep IN (...) lists under SQLite's bound-parameter limit
+CHUNK_SIZE = 500
+
+_PRIME = 4294967311  # smallest prime above 2 ** 32
+_rng = random.Random(1234)  # fixed seed: signatures are persisted and must be stable
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+# Column vectors so one broadcast hashes every shingle under every permutation
+_PERM_A = np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)[:, None]
+_PERM_B = np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)[:, None]
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_BRACKETED = re.compile(r"\(.*?\)|\[.*?\]")
+_COMPANY_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation",
+    "co", "company", "gmbh", "plc", "pvt", "private", "the",
+}
+
+
+def normalize_text(value: Optional[str]) -> str:
+    return " ".join(_NON_WORD.split((value or "").lower())).strip()
+
+
+def normalize_company(company: Optional[str]) -> str:
+    words = normalize_text(company).split()
+    return " ".join(w for w in words if w not in _COMPANY_SUFFIXES)
+
+
+def normalize_title(title: Optional[str]) -> str:
+    return normalize_text(_BRACKETED.sub(" ", title or ""))
+
+
+def normalize_location(location: Optional[str]) -> str:
+    # "New York, NY, United States" and "New York, US" both reduce to the city
+    return normalize_text((location or "").split(",")[0])
+
+
+def dedup_key(company: str, title: str, location: str) -> str:
+    parts = "|".join([normalize_company(company), normalize_title(title), normalize_location(location)])
+    return hashlib.sha1(parts.encode("utf-8")).hexdigest()[:20]
+
+
+def minhash_signature(text: Optional[str]) -> Optional[List[int]]:
+    """
+    MinHash signature over word shingles, or None if the text is too short to compare.
+    """
+    words = normalize_text(text).split()[:MAX_WORDS]
+    if len(words) < SHINGLE_SIZE:
+        return None
+    shingles = {
+        zlib.crc32(" ".join(words[i:i + SHINGLE_SIZE]).encode("utf-8"))
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+    x = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+    # (a * x + b) % _PRIME without overflowing uint64: a * x can exceed 2 ** 64, so x is
+    # split into 16-bit halves and reduced in between; every product stays below 2 ** 50
+    hashed = ((_PERM_A * (x >> np.uint64(16))) % _PRIME << np.uint64(16)) + _PERM_A * (x & np.uint64(0xFFFF)) + _PERM_B
+    return ((hashed % _PRIME).min(axis=1) & np.uint64(0xFFFFFFFF)).tolist()
+
+
+def fingerprint(company: Optional[str], title: Optional[str], location: Optional[str], description: Optional[str]) -> Dict:
+    """
+    Dedup columns for a posting, computed before it is written so the
+    upsert transaction only does indexed reads and writes.
+    """
+    return {
+        "dedup_key": dedup_key(company, title, location),
+        "minhash": pack_signature(minhash_signature(description)),
+    }
+
+
+def lsh_buckets(signature: Sequence[int]) -> List[str]:
+    buckets = []
+    for band in range(BANDS):
+        rows = array("I", signature[band * ROWS:(band + 1) * ROWS]).tobytes()
+        buckets.append(f"{band}:{zlib.crc32(rows):08x}")
+    return buckets
+
+
+def pack_signature(signature: Optional[Sequence[int]]) -> Optional[bytes]:
+    return array("I", signature).tobytes() if signature else None
+
+
+def unpack_signature(data: Optional[bytes]) -> Optional[List[int]]:
+    if not data:
+        return None
+    signature = array("I")
+    signature.frombytes(data)
+    return signature.tolist()
+
+
+def similarity(sig_a: Optional[Sequence[int]], sig_b: Optional[Sequence[int]]) -> float:
+    if not sig_a or not sig_b:
+        return 0.0
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+def _chunks(items: List, size: int = CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class _Candidate:
+    __slots__ = ("canonical_id", "job", "company", "key", "signature")
+
+    def __init__(self, job: models.Job, signature: Optional[List[int]]):
+        self.canonical_id = job.canonical_job_id
+        self.job = job
+        self.company = normalize_company(job.company)
+        self.key = job.dedup_key
+        self.signature = signature
+
+
+def resolve_duplicates(db: Session, jobs: List[models.Job]):
+    """
+    Link every not-yet-resolved job to its canonical job (possibly itself).
+
+    A job duplicates an existing one if it has the same normalized company,
+    title and location, or the same normalized company and a description whose
+    MinHash similarity is at least SIMILARITY_THRESHOLD. Candidates come from
+    indexed lookups on dedup_key and on the LSH band buckets of canonical jobs,
+    so the jobs table is never compared pairwise. Changes are left for the
+    caller to commit.
+    """
+    pending = [job for job in jobs if job.canonical_job_id is None]
+    if not pending:
+        return
+
+    signatures = {}
+    buckets = {}
+    for job in pending:
+        if job.dedup_key is None:
+            # Rows stored before fingerprints were written with the insert
+            for column, value in fingerprint(job.company, job.title, job.location, job.description).items():
+                setattr(job, column, value)
+        signature = unpack_signature(job.minhash)
+        signatures[job.id] = signature
+        buckets[job.id] = lsh_buckets(signature) if signature else []
+
+    # Candidate canonical jobs already in the table
+    pending_ids = {job.id for job in pending}
+    candidate_ids = set()
+    all_buckets = list({b for job_buckets in buckets.values() for b in job_buckets})
+    for chunk in _chunks(all_buckets):
+        candidate_ids.update(
+            job_id for (job_id,) in db.query(models.JobLSHBucket.job_id).filter(models.JobLSHBucket.bucket.in_(chunk))
+        )
+    keys = list({job.dedup_key for job in pending})
+
+    by_key: Dict[str, List[_Candidate]] = {}
+    by_bucket: Dict[str, List[_Candidate]] = {}
+    candidates = {}
+    existing = []
+    for chunk in _chunks(list(candidate_ids)):
+        existing.extend(db.query(models.Job).filter(models.Job.id.in_(chunk), models.Job.canonical_job_id.isnot(None)))
+    for chunk in _chunks(keys):
+        existing.extend(db.query(models.Job).filter(models.Job.dedup_key.in_(chunk), models.Job.canonical_job_id.isnot(None)))
+
+    def register(candidate: _Candidate, candidate_buckets: List[str]):
+        by_key.setdefault(candidate.key, []).append(candidate)
+        for bucket in candidate_buckets:
+            by_bucket.setdefault(bucket, []).append(candidate)
+
+    for job in existing:
+        if job.id in pending_ids or job.id in candidates:
+            continue
+        signature = unpack_signature(job.minhash)
+        candidates[job.id] = _Candidate(job, signature)
+        register(candidates[job.id], lsh_buckets(signature) if signature and job.canonical_job_id == job.id else [])
+
+    new_buckets = []
+    for job in pending:
+        company = normalize_company(job.company)
+        signature = signatures[job.id]
+
+        same_key = by_key.get(job.dedup_key)
+        match = same_key[0] if same_key else None
+        best = 0.0
+        if match is None:
+            seen = set()
+            for bucket in buckets[job.id]:
+                for candidate in by_bucket.get(bucket, []):
+                    if candidate.canonical_id in seen or candidate.company != company:
+                        continue
+                    seen.add(candidate.canonical_id)
+                    score = similarity(signature, candidate.signature)
+                    if score >= SIMILARITY_THRESHOLD and score > best:
+                        match, best = candidate, score
+
+        if match is not None:
+            job.canonical_job_id = match.canonical_id
+            canonical = match.job if match.job.id == match.canonical_id else None
+            if canonical is not None and not canonical.hr_email and job.hr_email:
+                # Keep the contact found by whichever provider had it
+                canonical.hr_email = job.hr_email
+        else:
+            job.canonical_job_id = job.id
+            new_buckets.extend({"bucket": bucket, "job_id": job.id} for bucket in buckets[job.id])
+
+        # Later jobs in this batch can match the ones resolved before them
+        candidate = _Candidate(job, signature)
+        register(candidate, buckets[job.id] if job.canonical_job_id == job.id else [])
+
+    if new_buckets:
+        db.bulk_insert_mappings(models.JobLSHBucket, new_buckets)
+
+
+def canonical_jobs(db: Session, jobs: List[models.Job]) -> List[models.Job]:
+    """
+    Map jobs to their canonical jobs, dropping repeats and keeping first-seen order.
+    """
+    loaded = {job.id: job for job in jobs}
+    missing = list({job.canonical_job_id for job in jobs if job.canonical_job_id and job.canonical_job_id not in loaded})
+    for chunk in _chunks(missing):
+        for job in db.query(models.Job).filter(models.Job.id.in_(chunk)):
+            loaded[job.id] = job
+
+    result = []
+    seen = set()
+    for job in jobs:
+        canonical = loaded.get(job.canonical_job_id or job.id, job)
+        if canonical.id not in seen:
+            seen.add(canonical.id)
+            result.append(canonical)
+    return result
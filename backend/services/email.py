@@ -1,58 +1,233 @@
+import logging
 import smtplib
+import threading
+import time
+from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from typing import Dict, List, Optional
 import os
+from .metrics import SMTP_SECONDS
+
+logger = logging.getLogger(__name__)
 
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
 SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
 SMTP_USER = os.getenv("SMTP_USER", "your_email@gmail.com")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "your_app_password")
 
+# Set SMTP_USE_TLS=false (and leave SMTP_PASSWORD empty) for a local debug server
+SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "30"))
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "2"))
+# Idle sessions older than this are NOOP-checked before reuse
+SMTP_HEALTHCHECK_AFTER = float(os.getenv("SMTP_HEALTHCHECK_AFTER", "10"))
+# Idle sessions older than this are dropped; most servers time out around 5 minutes
+SMTP_MAX_IDLE = float(os.getenv("SMTP_MAX_IDLE", "240"))
+
 from email.mime.base import MIMEBase
 from email import encoders
 
+
+def _is_connection_error(e: Exception) -> bool:
+    """
+    True if the session itself is unusable, as opposed to e.g. a refused recipient.
+    (SMTPException subclasses OSError, so socket errors are told apart explicitly.)
+    """
+    if isinstance(e, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    return isinstance(e, OSError) and not isinstance(e, smtplib.SMTPException)
+
+
+class SMTPPool:
+    """
+    Bounded pool of authenticated SMTP sessions reused across sends.
+    """
+
+    def __init__(self, host: str, port: int, user: str, password: str,
+                 use_tls: bool = True, size: int = 2, timeout: float = 30):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._idle = []  # (server, last_used) pairs, most recently used last
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            server.starttls()
+        if self.password:
+            server.login(self.user, self.password)
+        return server
+
+    @staticmethod
+    def _discard(server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    @staticmethod
+    def _is_healthy(server: smtplib.SMTP) -> bool:
+        try:
+            return server.noop()[0] == 250
+        except Exception:
+            return False
+
+    def _checkout(self) -> smtplib.SMTP:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                server, last_used = self._idle.pop()
+            idle_for = time.monotonic() - last_used
+            if idle_for > SMTP_MAX_IDLE:
+                self._discard(server)
+            elif idle_for > SMTP_HEALTHCHECK_AFTER and not self._is_healthy(server):
+                self._discard(server)
+            else:
+                return server
+        return self._connect()
+
+    def _checkin(self, server: smtplib.SMTP):
+        with self._lock:
+            self._idle.append((server, time.monotonic()))
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a live session; it is returned to the pool unless the
+        connection broke while in use.
+        """
+        self._slots.acquire()
+        server = None
+        try:
+            server = self._checkout()
+            yield server
+        except Exception as e:
+            if server is not None and _is_connection_error(e):
+                server.close()
+                server = None
+            raise
+        finally:
+            if server is not None:
+                self._checkin(server)
+            self._slots.release()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._discard(server)
+
+
+_pool = SMTPPool(SMTP_SERVER, SMTP_PORT, SMTP_USER, SMTP_PASSWORD,
+                 use_tls=SMTP_USE_TLS, size=SMTP_POOL_SIZE, timeout=SMTP_TIMEOUT)
+
+
+def _build_message(to_email: str, subject: str, body: str, attachment_path: str = None) -> MIMEMultipart:
+    msg = MIMEMultipart()
+    msg['From'] = SMTP_USER
+    msg['To'] = to_email
+    msg['Subject'] = subject
+
+    msg.attach(MIMEText(body, 'plain'))
+
+    if attachment_path and os.path.exists(attachment_path):
+        with open(attachment_path, "rb") as attachment:
+            part = MIMEBase("application", "octet-stream")
+            part.set_payload(attachment.read())
+
+        encoders.encode_base64(part)
+        part.add_header(
+            "Content-Disposition",
+            f"attachment; filename= {os.path.basename(attachment_path)}",
+        )
+        msg.attach(part)
+    elif attachment_path:
+         logger.warning("Attachment not found at %s", attachment_path)
+
+    return msg
+
+
+def _is_mocked() -> bool:
+    return SMTP_USER == "your_email@gmail.com"
+
+
+def _mock_send(to_email: str, subject: str, body: str, attachment_path: str = None):
+    logger.info(
+        "Mocking email send to=%s subject=%r body=%r attachment=%s",
+        to_email, subject, body[:50], attachment_path
+    )
+
+
 def send_email(to_email: str, subject: str, body: str, attachment_path: str = None):
     """
     Send an email using SMTP with optional attachment.
     """
-    if SMTP_USER == "your_email@gmail.com":
-        print("Mocking Email Send:")
-        print(f"To: {to_email}")
-        print(f"Subject: {subject}")
-        print(f"Body: {body[:50]}...")
-        if attachment_path:
-            print(f"Attachment: {attachment_path}")
+    if _is_mocked():
+        _mock_send(to_email, subject, body, attachment_path)
         return True
 
-    try:
-        msg = MIMEMultipart()
-        msg['From'] = SMTP_USER
-        msg['To'] = to_email
-        msg['Subject'] = subject
-
-        msg.attach(MIMEText(body, 'plain'))
-
-        if attachment_path and os.path.exists(attachment_path):
-            with open(attachment_path, "rb") as attachment:
-                part = MIMEBase("application", "octet-stream")
-                part.set_payload(attachment.read())
-            
-            encoders.encode_base64(part)
-            part.add_header(
-                "Content-Disposition",
-                f"attachment; filename= {os.path.basename(attachment_path)}",
-            )
-            msg.attach(part)
-        elif attachment_path:
-             print(f"Warning: Attachment not found at {attachment_path}")
-
-        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-        server.starttls()
-        server.login(SMTP_USER, SMTP_PASSWORD)
-        text = msg.as_string()
-        server.sendmail(SMTP_USER, to_email, text)
-        server.quit()
-        return True
-    except Exception as e:
-        print(f"Failed to send email: {e}")
-        return False
+    return send_many([{
+        "to_email": to_email,
+        "subject": subject,
+        "body": body,
+        "attachment_path": attachment_path,
+    }])[0]
+
+
+def send_many(messages: List[Dict]) -> List[bool]:
+    """
+    Send a batch of emails over one pooled SMTP session.
+    Each message is a dict of send_email's arguments; returns one success flag per message.
+    If the session drops mid-batch, the remaining messages continue on a fresh one.
+    """
+    if _is_mocked():
+        for message in messages:
+            _mock_send(**message)
+        return [True] * len(messages)
+
+    results: List[Optional[bool]] = [None] * len(messages)
+    payloads = [None] * len(messages)
+    for index, message in enumerate(messages):
+        try:
+            payloads[index] = _build_message(**message).as_string()
+        except Exception as e:
+            logger.error("Failed to build email to=%s: %s", message.get("to_email"), e)
+            results[index] = False
+
+    reconnects = 0
+    while None in results:
+        try:
+            with _pool.connection() as server:
+                for index, message in enumerate(messages):
+                    if results[index] is not None:
+                        continue
+                    started = time.perf_counter()
+                    try:
+                        server.sendmail(SMTP_USER, message["to_email"], payloads[index])
+                        results[index] = True
+                        SMTP_SECONDS.observe(time.perf_counter() - started, outcome="sent")
+                    except Exception as e:
+                        SMTP_SECONDS.observe(time.perf_counter() - started, outcome="error")
+                        if _is_connection_error(e):
+                            raise
+                        logger.error("Failed to send email to=%s: %s", message["to_email"], e)
+                        results[index] = False
+        except Exception as e:
+            # Connection-level failure: retry the unsent messages once on a new session
+            reconnects += 1
+            if reconnects > 1:
+                logger.error("Failed to send email batch after reconnect: %s", e)
+                return [bool(result) for result in results]
+
+    return results
+
+
+def close_pool():
+    _pool.close()
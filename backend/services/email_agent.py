@@ -1,18 +1,41 @@
+import asyncio
+import hashlib
+import json
+import logging
 import os
-import google.generativeai as genai
+import threading
+from typing import Dict, List, Tuple, Union
+from . import gemini
+from .gemini import GEMINI_API_KEY
+from .metrics import GEMINI_SECONDS
 
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+logger = logging.getLogger(__name__)
 
-def generate_email_content(user_details: dict, job_details: dict) -> str:
+# Upper bound on Gemini generations in flight across the whole process
+GENERATION_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "4"))
+
+_loop = None
+_loop_lock = threading.Lock()
+_semaphore = None
+
+
+def _hash(values: List) -> str:
+    payload = json.dumps([v or '' for v in values], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def content_key(user_details: dict, job_details: dict) -> str:
     """
-    Generate a highly personalized cold email using Google Gemini.
+    (profile hash, job content hash) of every input the prompt depends on.
+    Two attempts with the same key would get the same email, so it can be reused.
     """
-    
-    # Validation to ensure we don't proceed without a key
-    if not GEMINI_API_KEY:
-        raise ValueError("API Key is missing. Please set GEMINI_API_KEY environment variable.")
+    profile_hash = _hash([user_details.get('name'), user_details.get('skills'), user_details.get('experience')])
+    job_hash = _hash([job_details.get('title'), job_details.get('company'), job_details.get('description')])
+    return f"{profile_hash}:{job_hash}"
+
 
-    prompt = f"""
+def _build_prompt(user_details: dict, job_details: dict) -> str:
+    return f"""
 Write a natural, human-sounding cold email for a job application. It should feel personal,
 thoughtful, and written by a real person — not an AI or a template.
 
@@ -38,13 +61,83 @@ Job details:
 Return only the email body. Do not include a subject or any additional explanations.
 """
 
+
+def generate_email_content(user_details: dict, job_details: dict) -> str:
+    """
+    Generate a highly personalized cold email using Google Gemini.
+    """
+    
+    # Validation to ensure we don't proceed without a key
+    if not GEMINI_API_KEY:
+        raise ValueError("API Key is missing. Please set GEMINI_API_KEY environment variable.")
+
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-2.5-flash') 
-        response = model.generate_content(prompt)
+        with GEMINI_SECONDS.time(operation="email"):
+            response = gemini.get_model().generate_content(_build_prompt(user_details, job_details))
         return response.text
         
     except Exception as e:
         # Log the error for debugging, but raise it so the application knows the email failed.
-        print(f"Critical Error in Gemini Generation: {e}")
-        raise e
\ No newline at end of file
+        logger.error("Critical Error in Gemini Generation: %s", e)
+        raise e
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    One background event loop for all async generations, so the model's async
+    client and the concurrency semaphore are bound to a single loop.
+    """
+    global _loop, _semaphore
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _semaphore = asyncio.Semaphore(GENERATION_CONCURRENCY)
+            threading.Thread(target=_loop.run_forever, name="gemini", daemon=True).start()
+    return _loop
+
+
+async def _generate_async(prompt: str) -> str:
+    async with _semaphore:
+        with GEMINI_SECONDS.time(operation="email"):
+            response = await gemini.get_model().generate_content_async(prompt)
+        return response.text
+
+
+async def generate_email_content_async(user_details: Dict, job_details: Dict) -> str:
+    """
+    generate_email_content for async callers: runs on the shared Gemini loop (so it
+    counts against GENERATION_CONCURRENCY) and holds no thread while it waits.
+    """
+    if not GEMINI_API_KEY:
+        raise ValueError("API Key is missing. Please set GEMINI_API_KEY environment variable.")
+
+    future = asyncio.run_coroutine_threadsafe(_generate_async(_build_prompt(user_details, job_details)), _get_loop())
+    try:
+        return await asyncio.wrap_future(future)
+    except Exception as e:
+        logger.error("Critical Error in Gemini Generation: %s", e)
+        raise
+
+
+def generate_many(pairs: List[Tuple[Dict, Dict]]) -> List[Union[str, Exception]]:
+    """
+    Generate emails for several (user_details, job_details) pairs concurrently,
+    at most GENERATION_CONCURRENCY at a time. Returns the content or the
+    exception for each pair, in order.
+    """
+    if not GEMINI_API_KEY:
+        raise ValueError("API Key is missing. Please set GEMINI_API_KEY environment variable.")
+
+    loop = _get_loop()
+    futures = [
+        asyncio.run_coroutine_threadsafe(_generate_async(_build_prompt(user_details, job_details)), loop)
+        for user_details, job_details in pairs
+    ]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            logger.error("Critical Error in Gemini Generation: %s", e)
+            results.append(e)
+    return results
@@ -0,0 +1,18 @@
+import functools
+import os
+
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+GEMINI_MODEL = "gemini-2.5-flash"
+
+
+@functools.lru_cache(maxsize=1)
+def get_model():
+    """
+    Configure the Gemini SDK and build the model client once per process.
+    Shared by every agent so the SDK is never reconfigured per call. The SDK is
+    imported here rather than at module level: it takes over half a second to load.
+    """
+    import google.generativeai as genai
+
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai.GenerativeModel(GEMINI_MODEL)
@@ -0,0 +1,183 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from .. import models
+from ..database import SessionLocal
+from . import job_filter_agent, job_store, providers
+from .cache import canonical_key
+from .job_record import JobRecord
+
+logger = logging.getLogger(__name__)
+
+# Seconds between ingestion runs
+INGESTION_INTERVAL = float(os.getenv("INGESTION_INTERVAL", "3600"))
+# Concurrent requests per provider, so a run never bursts a provider's quota
+INGESTION_CONCURRENCY = int(os.getenv("INGESTION_CONCURRENCY_PER_PROVIDER", "2"))
+# Window used for a query's first run
+INITIAL_LOOKBACK = timedelta(days=int(os.getenv("INGESTION_INITIAL_LOOKBACK_DAYS", "3")))
+
+
+def derive_queries(db) -> List[Dict]:
+    """
+    Distinct title/location searches implied by all user profiles.
+    Uses the same (memoized) filter generation as interactive searches.
+    """
+    queries = {}
+    for skills, experience, location in db.query(models.User.skills, models.User.experience, models.User.location):
+        user_details = {"skills": skills, "experience": experience, "location": location}
+        generated = job_filter_agent.generate_search_filters(user_details, "")
+        filters = {
+            "title_filter": generated.get("title_filter") or "Software Engineer",
+            "location_filter": generated.get("location_filter") or location or "",
+        }
+        if generated.get("remote") == "true":
+            filters["remote"] = "true"
+        queries.setdefault(canonical_key(filters), filters)
+    return [dict(filters, query_key=key) for key, filters in queries.items()]
+
+
+def _jsearch_date_posted(since: datetime, now: datetime) -> str:
+    age = now - since
+    if age <= timedelta(days=1):
+        return "today"
+    if age <= timedelta(days=3):
+        return "3days"
+    if age <= timedelta(days=7):
+        return "week"
+    if age <= timedelta(days=30):
+        return "month"
+    return "all"
+
+
+def incremental_filters(filters: Dict, since: datetime, now: datetime) -> Dict:
+    """
+    Restrict a query to postings newer than the high-water mark.
+    """
+    incremental = {k: v for k, v in filters.items() if k != "query_key"}
+    incremental["date_filter"] = since.strftime("%Y-%m-%dT%H:%M:%S")
+    incremental["jsearch_date_posted"] = _jsearch_date_posted(since, now)
+    return incremental
+
+
+class IngestionScheduler:
+    """
+    Periodically pre-fetches postings for every profile-derived query and stores
+    them through the bulk upsert path, so the local store stays warm.
+    """
+
+    def __init__(self, interval: float = INGESTION_INTERVAL, concurrency: int = INGESTION_CONCURRENCY):
+        self.interval = interval
+        self._executors = {
+            name: ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"ingest-{name}")
+            for name in providers.PROVIDER_NAMES
+        }
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_once(self) -> Dict[str, int]:
+        """
+        Run every query once; returns the number of jobs fetched per query key.
+        """
+        db = SessionLocal()
+        try:
+            queries = derive_queries(db)
+            states = {(state.query_key, state.provider): state for state in db.query(models.IngestionState)}
+        finally:
+            db.close()
+
+        now = datetime.utcnow()
+        searches = providers.get_providers()
+        pending = []
+        for query in queries:
+            futures = {}
+            for name, executor in self._executors.items():
+                # Each provider resumes from its own mark, so one provider's outage skips no window of another's
+                state = states.get((query["query_key"], name))
+                since = state.last_run_at if state and state.last_run_at else now - INITIAL_LOOKBACK
+                filters = incremental_filters(query, since, now)
+                # Bypass the result cache: each run asks for a new window anyway
+                futures[name] = executor.submit(getattr(searches[name], "__wrapped__", searches[name]), filters)
+            pending.append((query, futures))
+
+        fetched_counts = {}
+        for query, futures in pending:
+            results = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result() or []
+                except Exception as e:
+                    logger.error("Ingestion from %s failed for title=%r: %s", name, query["title_filter"], e)
+                    results[name] = None
+            fetched_counts[query["query_key"]] = sum(len(jobs) for jobs in results.values() if jobs)
+            self._store(query, results, now)
+        return fetched_counts
+
+    @staticmethod
+    def _store(query: Dict, results: Dict[str, Optional[List[JobRecord]]], run_started: datetime):
+        """
+        Store one query's postings and advance the mark of each provider that answered.
+        A provider whose search failed has None in `results` and keeps its mark.
+        """
+        db = SessionLocal()
+        try:
+            fetched = [job for jobs in results.values() if jobs for job in jobs]
+            if fetched:
+                job_store.upsert_jobs(db, fetched)
+            states = {
+                state.provider: state for state in db.query(models.IngestionState).filter(
+                    models.IngestionState.query_key == query["query_key"]
+                )
+            }
+            for name, jobs in results.items():
+                state = states.get(name)
+                if state is None:
+                    state = models.IngestionState(
+                        query_key=query["query_key"],
+                        provider=name,
+                        title=query["title_filter"],
+                        location=query.get("location_filter")
+                    )
+                    db.add(state)
+                # Only advance the mark when the provider answered; an outage must not skip a window
+                if jobs is not None:
+                    state.last_run_at = run_started
+                    state.last_job_count = len(jobs)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error("Storing ingested jobs failed for title=%r: %s", query["title_filter"], e)
+        finally:
+            db.close()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                counts = self.run_once()
+                logger.info("Ingestion run stored %d jobs for %d queries", sum(counts.values()), len(counts))
+            except Exception as e:
+                logger.exception("Ingestion run failed: %s", e)
+            self._stop.wait(self.interval)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="ingestion", daemon=True)
+            self._thread.start()
+
+    def join(self, timeout: Optional[float] = None):
+        """
+        Block until the scheduler thread exits (after stop()) or the timeout passes.
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,9 +1,35 @@
 import os
 import json
-import google.generativeai as genai
+import hashlib
+import logging
 from typing import Dict
+from .cache import get_cache
+from . import gemini
+from .gemini import GEMINI_API_KEY
+from .metrics import GEMINI_SECONDS
 
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+logger = logging.getLogger(__name__)
+
+# Generated filters only depend on the profile + query, so keep them for a day
+FILTER_CACHE_TTL = float(os.getenv("FILTER_CACHE_TTL", "86400"))
+_filter_cache = get_cache("search_filters", FILTER_CACHE_TTL)
+
+
+def filters_cache_key(user_details: Dict, user_query: str) -> str:
+    """
+    Hash of every input the prompt depends on. Editing any profile field
+    yields a new key, so a changed profile never reads stale filters.
+    """
+    payload = json.dumps(
+        [
+            user_details.get('skills') or '',
+            user_details.get('experience') or '',
+            user_details.get('location') or '',
+            " ".join((user_query or '').split()).lower(),
+        ],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 def generate_search_filters(user_details: Dict, user_query: str) -> Dict:
     """
@@ -11,9 +37,15 @@ def generate_search_filters(user_details: Dict, user_query: str) -> Dict:
     """
     
     if not GEMINI_API_KEY:
-        print("WARNING: GEMINI_API_KEY not set. Using default filters.")
+        logger.warning("GEMINI_API_KEY not set. Using default filters.")
         return {"title_filter": user_query}
 
+    cache_key = filters_cache_key(user_details, user_query)
+    cached_filters = _filter_cache.get(cache_key)
+    if cached_filters is not None:
+        # Callers add to the returned dict, so never hand out the cached one
+        return dict(cached_filters)
+
     prompt = f"""
     You are an expert search query optimizer for a Job Search API.
     Your goal is to translate a user's natural language search query and their professional profile into a precise set of API filters.
@@ -66,9 +98,8 @@ def generate_search_filters(user_details: Dict, user_query: str) -> Dict:
     """
 
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content(prompt)
+        with GEMINI_SECONDS.time(operation="filters"):
+            response = gemini.get_model().generate_content(prompt)
         
         # Clean response text to ensure valid JSON (remove backticks if any)
         text_response = response.text.strip()
@@ -78,9 +109,10 @@ def generate_search_filters(user_details: Dict, user_query: str) -> Dict:
                 text_response = text_response[4:]
         
         filters = json.loads(text_response)
-        return filters
+        _filter_cache.set(cache_key, filters)
+        return dict(filters)
 
     except Exception as e:
-        print(f"Error generating search filters: {e}")
+        logger.error("Error generating search filters: %s", e)
         # Fallback to basic search if AI fails
         return {"title_filter": user_query}
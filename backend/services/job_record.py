@@ -0,0 +1,110 @@
+from dataclasses import asdict, dataclass, replace
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import requests
+from .utils import best_emails
+
+try:
+    import ijson
+except ImportError:  # optional: fall back to parsing the whole body at once
+    ijson = None
+
+
+@dataclass(frozen=True, slots=True)
+class JobRecord:
+    """
+    One normalized provider posting. Every adapter produces these via make_record,
+    so each field is stored once regardless of the provider's own field names.
+    """
+    job_id: str
+    job_title: str
+    company_name: str
+    location: str
+    description: str
+    hr_email: Optional[str]
+    url: str
+    posted_at: Optional[str]
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def make_record(
+    job_id,
+    job_title,
+    company_name,
+    location,
+    description,
+    url,
+    posted_at=None,
+    hr_email=None,
+) -> JobRecord:
+    """
+    The single normalization path for provider postings.
+    hr_email is normally filled in for a whole page at once by read_page.
+    """
+    description = description or ""
+    return JobRecord(
+        job_id=str(job_id or ""),
+        job_title=job_title or "",
+        company_name=company_name or "",
+        location=location or "",
+        description=description or "No description",
+        hr_email=hr_email,
+        url=url or "#",
+        posted_at=str(posted_at) if posted_at else None,
+    )
+
+
+def from_dicts(values: Iterable[Dict]) -> List[JobRecord]:
+    """
+    Rebuild records that were serialized with to_dict (e.g. by the shared cache tier).
+    """
+    return [JobRecord(**value) for value in values]
+
+
+def iter_items(response: requests.Response, key: str = "data") -> Iterator[Dict]:
+    """
+    Yield the postings in a provider response, whether the body is a bare list or
+    an object holding the list under `key`.
+
+    With ijson installed the body is parsed incrementally from the socket, so only
+    one raw posting is in memory at a time; the response should be requested with
+    stream=True. Without ijson the whole body is parsed first.
+    """
+    if ijson is None:
+        data = response.json()
+        yield from (data if isinstance(data, list) else data.get(key) or [])
+        return
+
+    response.raw.decode_content = True
+    events = ijson.parse(response.raw, use_float=True)
+    first = next(events, None)
+    if first is None:
+        return
+    prefix = "item" if first[1] == "start_array" else f"{key}.item"
+    yield from ijson.items(chain([first], events), prefix)
+
+
+def read_page(
+    response: requests.Response,
+    normalize: Callable[[Dict], Optional[JobRecord]],
+    key: str = "data",
+) -> Tuple[int, List[JobRecord]]:
+    """
+    Normalize a page of postings as it is parsed and pick each posting's contact
+    address. Returns (raw_item_count, records); postings for which normalize
+    returns None are dropped.
+    """
+    raw_count = 0
+    records = []
+    for item in iter_items(response, key):
+        raw_count += 1
+        record = normalize(item)
+        if record is not None:
+            records.append(record)
+
+    # One contact-extraction pass over the whole page
+    emails = best_emails(record.description for record in records)
+    records = [replace(record, hr_email=email) if email else record for record, email in zip(records, emails)]
+    return raw_count, records
@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Dict, Iterable, List
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
+from .. import models
+from . import dedup, ranking
+from .job_record import JobRecord
+
+# Keep each multi-row INSERT / IN (...) well under SQLite's bound-parameter limit.
+CHUNK_SIZE = 100
+
+_DIALECT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def _to_row(record: JobRecord, fetched_at: datetime) -> Dict:
+    return {
+        "rapidapi_id": record.job_id,
+        "title": record.job_title,
+        "company": record.company_name,
+        "location": record.location,
+        "description": record.description,
+        "hr_email": record.hr_email,
+        "url": record.url,
+        "posted_at": fetched_at,
+    }
+
+
+def _chunks(items: List, size: int = CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def upsert_jobs(db: Session, fetched_jobs: Iterable[JobRecord]) -> List[models.Job]:
+    """
+    Persist provider jobs in one transaction and return the stored rows in input order.
+
+    Postings not stored yet get their dedup fingerprint and ranking vector
+    computed up front, before the first write: on SQLite the write lock is held
+    from the INSERT to the commit, so only indexed reads and writes happen in between.
+    New jobs are written with INSERT ... ON CONFLICT (rapidapi_id) DO NOTHING, so
+    concurrent searches inserting the same posting cannot trip the unique index.
+    The stored rows are then read back with a single IN (...) lookup per chunk,
+    and newly inserted ones are linked to their canonical job before the commit.
+    """
+    fetched_at = datetime.utcnow()
+    rows = {}
+    for record in fetched_jobs:
+        rows.setdefault(record.job_id, _to_row(record, fetched_at))
+
+    if not rows:
+        return []
+
+    rapidapi_ids = list(rows)
+    existing = set()
+    for chunk in _chunks(rapidapi_ids):
+        existing.update(
+            rid for (rid,) in db.query(models.Job.rapidapi_id).filter(models.Job.rapidapi_id.in_(chunk))
+        )
+    new_rows = [row for rid, row in rows.items() if rid not in existing]
+    for row in new_rows:
+        row.update(dedup.fingerprint(row["company"], row["title"], row["location"], row["description"]))
+        row["feature_vector"] = ranking.pack_vector(*ranking.posting_vector(row["title"], row["company"], row["description"]))
+
+    insert = _DIALECT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        # A concurrent search may have stored some of these since the lookup; those rows are skipped
+        for chunk in _chunks(new_rows):
+            stmt = insert(models.Job).values(chunk).on_conflict_do_nothing(index_elements=["rapidapi_id"])
+            db.execute(stmt)
+    else:
+        # Dialects without ON CONFLICT support: add only the rows the lookup did not find
+        db.add_all(models.Job(**row) for row in new_rows)
+        db.flush()
+
+    stored = {}
+    for chunk in _chunks(rapidapi_ids):
+        for db_job in db.query(models.Job).filter(models.Job.rapidapi_id.in_(chunk)):
+            stored[db_job.rapidapi_id] = db_job
+    stored_jobs = [stored[rid] for rid in rapidapi_ids if rid in stored]
+
+    # Link new rows to their cross-provider canonical job in the same transaction
+    dedup.resolve_duplicates(db, stored_jobs)
+    # Only rows stored before vectors were written with the insert still need one
+    ranking.ensure_vectors(stored_jobs)
+
+    # The rows were just read and written here; don't reload each one after commit
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+
+    return stored_jobs
@@ -1,16 +1,41 @@
-import requests
+import logging
 import os
-from typing import List, Dict
-from .utils import extract_email
+from typing import List, Dict, Optional, Tuple
+from . import provider_http, resilience
+from .job_record import JobRecord, make_record, read_page
+from .pagination import DEFAULT_MAX_RESULTS, collect_pages, page_count
+
+logger = logging.getLogger(__name__)
 
 # Credentials
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
 RAPIDAPI_HOST = "jsearch.p.rapidapi.com"
+# JSearch returns up to 10 results per page
+PAGE_SIZE = 10
+
+# Token bucket sized to this host's RapidAPI plan (JSEARCH_RATE_PER_MINUTE / JSEARCH_RATE_BURST)
+resilience.configure_host(RAPIDAPI_HOST, "JSEARCH")
+
 
+def _normalize(item: Dict) -> Optional[JobRecord]:
+    # JSearch returns rich data, map carefully
+    if not item.get("job_title"):
+        return None
+    return make_record(
+        job_id=item.get("job_id"),
+        job_title=item.get("job_title"),
+        company_name=item.get("employer_name"),
+        location=item.get("job_location") or f"{item.get('job_city')}, {item.get('job_country')}",
+        description=item.get("job_description"),
+        url=item.get("job_apply_link") or item.get("job_google_link"),
+        posted_at=item.get("job_posted_at_datetime_utc"),
+    )
 
-def search_jobs(filters: Dict) -> List[Dict]:
+
+def search_jobs(filters: Dict, max_results: int = DEFAULT_MAX_RESULTS) -> List[JobRecord]:
     """
     Search for jobs using JSearch RapidAPI.
+    Fetches enough pages concurrently to reach max_results.
     """
     url = f"https://{RAPIDAPI_HOST}/search"
     
@@ -24,7 +49,6 @@ def search_jobs(filters: Dict) -> List[Dict]:
     # Base params
     querystring = {
         "query": query_val,
-        "page": "1",
         "num_pages": "1",
         "country": "us" # Default, could extract from location if sophisticated, but agent can pass jsearch_country if needed.
     }
@@ -60,41 +84,17 @@ def search_jobs(filters: Dict) -> List[Dict]:
         "x-rapidapi-host": RAPIDAPI_HOST
     }
 
-    print(f"DEBUG: JSearch Params: {querystring}")
-
-    try:
-        response = requests.get(url, headers=headers, params=querystring)
-        print(f"DEBUG: JSearch Status: {response.status_code}")
-        response.raise_for_status()
-        
-        data = response.json()
-        jobs_list = data.get("data", [])
-        
-        normalized_jobs = []
-        for item in jobs_list:
-            description = item.get("job_description") or ""
-            hr_email = extract_email(description)
+    logger.debug("JSearch params=%s", querystring)
 
-            # JSearch returns rich data, map carefully
-            job_obj = {
-                "job_id": str(item.get("job_id")),
-                "job_title": item.get("job_title"),
-                "company_name": item.get("employer_name"),
-                "location": item.get("job_location") or f"{item.get('job_city')}, {item.get('job_country')}",
-                "description": description or "No description",
-                "job_description": description or "No description",
-                "hr_email": hr_email,
-                "url": item.get("job_apply_link") or item.get("job_google_link") or "#",
-                "linkedin_job_url_cleaned": item.get("job_apply_link") or "#",
-                "posted_at": item.get("job_posted_at_datetime_utc")
-            }
-            
-            if job_obj["job_title"]:
-                 normalized_jobs.append(job_obj)
-                 
-        print(f"DEBUG: JSearch found {len(normalized_jobs)} jobs")
-        return normalized_jobs
+    def fetch_page(index: int) -> Tuple[int, List[JobRecord]]:
+        params = dict(querystring, page=str(index + 1))
+        with provider_http.get(url, headers=headers, params=params, stream=True) as response:
+            logger.debug("JSearch page=%d status=%d", index, response.status_code)
+            response.raise_for_status()
+            return read_page(response, _normalize)
 
-    except Exception as e:
-        print(f"ERROR in jsearch.search_jobs: {e}")
-        return []
+    # A first-page error propagates so the caller skips this provider; later pages degrade to a partial result
+    normalized_jobs = collect_pages(fetch_page, page_count(max_results, PAGE_SIZE), PAGE_SIZE, "JSearch")
+    normalized_jobs = normalized_jobs[:max_results]
+    logger.debug("JSearch returned %d jobs", len(normalized_jobs))
+    return normalized_jobs
@@ -1,28 +1,53 @@
-import requests
-print("DEBUG: linkedin.py LOADED")
+import logging
 import os
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from urllib.parse import quote
-from .utils import extract_email
+from . import provider_http, resilience
+from .job_record import JobRecord, make_record, read_page
+from .pagination import DEFAULT_MAX_RESULTS, collect_pages, page_count
+
+logger = logging.getLogger(__name__)
 
 # Load from environment or use defaults
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY", "0497530d8cmsh56f0d2763d130e5p1a652djsnf5c0fd191f89")
 RAPIDAPI_HOST = os.getenv("RAPIDAPI_HOST", "linkedin-job-search-api.p.rapidapi.com")
+PAGE_SIZE = int(os.getenv("LINKEDIN_PAGE_SIZE", "10"))
+
+# Token bucket sized to this host's RapidAPI plan (LINKEDIN_RATE_PER_MINUTE / LINKEDIN_RATE_BURST)
+resilience.configure_host(RAPIDAPI_HOST, "LINKEDIN")
+
+
+def _normalize(item: Dict) -> JobRecord:
+    # Map API fields to our internal model
+    # Based on debug: 'description_text' holds the Description, 'organization' is company name
 
+    # Location parsing
+    loc_derived = item.get("locations_derived")
+    location = loc_derived[0] if loc_derived and isinstance(loc_derived, list) else ""
 
-def search_jobs(filters: Dict) -> List[Dict]:
+    return make_record(
+        job_id=item.get("id") or item.get("job_id"),
+        job_title=item.get("title") or item.get("job_title"),
+        company_name=item.get("organization"),
+        location=location,
+        description=item.get("description_text") or item.get("description") or item.get("job_description"),
+        url=item.get("url") or item.get("linkedin_job_url_cleaned"),
+        posted_at=item.get("date_posted") or item.get("posted_date"),
+    )
+
+
+def search_jobs(filters: Dict, max_results: int = DEFAULT_MAX_RESULTS) -> List[JobRecord]:
     """
     Search for jobs using RapidAPI LinkedIn Job Search API (active-jb-24h).
+    Fetches enough limit/offset pages concurrently to reach max_results.
     """
     url = f"https://{RAPIDAPI_HOST}/active-jb-24h"
-    
+
     # Defaults
     querystring = {
-        "limit": "10",
-        "offset": "0",
         "description_type": "text"
     }
-    
+
     # Merge dynamic filters (overriding defaults if present)
     if filters:
         querystring.update(filters)
@@ -32,52 +57,18 @@ def search_jobs(filters: Dict) -> List[Dict]:
         "x-rapidapi-host": RAPIDAPI_HOST
     }
 
-    print("DEBUG: Inside search_jobs")
-    try:
-        print("DEBUG: Making request...")
-        response = requests.get(url, headers=headers, params=querystring)
-        print(f"DEBUG: Response status: {response.status_code}")
-        response.raise_for_status()
-        data = response.json()
-        print(f"DEBUG: Raw API Data: {data}")
-        print(f"DEBUG: Key used: {RAPIDAPI_KEY[:5]}...")
-        
-        # The API returns a list of jobs directly or a dict with 'data'?
-        # Based on typical usage of this specific API 'active-jb-24h', it usually returns a list or a paginated dict.
-        # Let's handle list or dict['data'].
-        
-        jobs_list = data if isinstance(data, list) else data.get('data', [])
-        print(f"DEBUG: jobs_list len: {len(jobs_list)}")
-        
-        normalized_jobs = []
-        for item in jobs_list:
-            # Map API fields to our internal model
-            # Based on debug: 'description_text' holds the Description, 'organization' is company name
-            
-            description = item.get("description_text") or item.get("description") or item.get("job_description") or ""
-            
-            # Attempt to extract HR email
-            hr_email = extract_email(description)
-            
-            # Location parsing
-            loc_derived = item.get("locations_derived")
-            location = loc_derived[0] if loc_derived and isinstance(loc_derived, list) else ""
-            
-            job_obj = {
-                "job_id": str(item.get("id") or item.get("job_id") or ""),
-                "job_title": item.get("title") or item.get("job_title") or "",
-                "company_name": item.get("organization") or "",
-                "location": location or "",
-                "job_description": description or "No description",
-                "hr_email": hr_email,
-                "linkedin_job_url_cleaned": item.get("url") or item.get("linkedin_job_url_cleaned") or "#",
-                "posted_date": item.get("date_posted") or item.get("posted_date")
-            }
-            normalized_jobs.append(job_obj)
-            
-        print(f"DEBUG: Returning {len(normalized_jobs)} jobs.")
-        return normalized_jobs
+    def fetch_page(index: int) -> Tuple[int, List[JobRecord]]:
+        params = dict(querystring, limit=str(PAGE_SIZE), offset=str(index * PAGE_SIZE))
+        with provider_http.get(url, headers=headers, params=params, stream=True) as response:
+            logger.debug("LinkedIn page=%d status=%d", index, response.status_code)
+            response.raise_for_status()
+            # The API returns a list of jobs directly or a dict with 'data'; parsed as it streams
+            raw_count, records = read_page(response, _normalize)
+        logger.debug("LinkedIn page=%d items=%d", index, raw_count)
+        return raw_count, records
 
-    except Exception as e:
-        print(f"DEBUG: EXCEPTION in search_jobs: {e}")
-        return []
+    # A first-page error propagates so the caller skips this provider; later pages degrade to a partial result
+    normalized_jobs = collect_pages(fetch_page, page_count(max_results, PAGE_SIZE), PAGE_SIZE, "LinkedIn")
+    normalized_jobs = normalized_jobs[:max_results]
+    logger.debug("LinkedIn returned %d jobs", len(normalized_jobs))
+    return normalized_jobs
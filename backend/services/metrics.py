@@ -0,0 +1,192 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Latency buckets (seconds) shared by every histogram
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(labelnames: Sequence[str], values: Tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple, object] = {}
+
+    def _key(self, labels: Dict) -> Tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            series = sorted(self._series.items())
+        for key, value in series:
+            lines.extend(self._render_series(key, value))
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+    def _render_series(self, key, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._series.get(key) or ([0] * len(self.buckets), 0.0)
+            counts[bisect_left(self.buckets, value)] += 1
+            self._series[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels):
+        """
+        Observe the duration of the block. If the histogram has an "outcome" label
+        that is not given, it is set to "ok" or "error" depending on whether the block raised.
+        """
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            yield
+        except BaseException:
+            outcome = "error"
+            raise
+        finally:
+            if "outcome" in self.labelnames:
+                labels.setdefault("outcome", outcome)
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _render_series(self, key, value) -> List[str]:
+        counts, total = value
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+_registry: List[_Metric] = []
+
+
+def _register(metric):
+    _registry.append(metric)
+    return metric
+
+
+def render() -> str:
+    """
+    All metrics in the Prometheus text exposition format (version 0.0.4).
+    """
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+HTTP_REQUEST_SECONDS = _register(Histogram(
+    "http_request_duration_seconds", "Time to serve a request, including streamed bodies.",
+    ["method", "route", "status"],
+))
+HTTP_REQUEST_DB_SECONDS = _register(Histogram(
+    "http_request_db_seconds", "Time spent executing SQL while serving a request.",
+    ["route"],
+))
+PROVIDER_SECONDS = _register(Histogram(
+    "provider_search_duration_seconds", "Time for one provider search, all pages included.",
+    ["provider"],
+))
+PROVIDER_RESULTS = _register(Counter(
+    "provider_results_total", "Postings returned by each provider.",
+    ["provider"],
+))
+PROVIDER_ERRORS = _register(Counter(
+    "provider_errors_total", "Provider searches that failed, by reason (unavailable, error, timeout).",
+    ["provider", "reason"],
+))
+GEMINI_SECONDS = _register(Histogram(
+    "gemini_request_duration_seconds", "Gemini generation time by operation.",
+    ["operation", "outcome"],
+))
+SMTP_SECONDS = _register(Histogram(
+    "smtp_send_duration_seconds", "Time to hand one message to the SMTP server.",
+    ["outcome"],
+))
+
+
+# SQL time of the request being served; a mutable holder so worker threads add to it
+_db_time: ContextVar[Optional[List[float]]] = ContextVar("db_time", default=None)
+
+
+def start_request_db_timer() -> List[float]:
+    holder = [0.0]
+    _db_time.set(holder)
+    return holder
+
+
+def add_db_time(seconds: float):
+    holder = _db_time.get()
+    if holder is not None:
+        holder[0] += seconds
+
+
+def instrument_engine(engine):
+    """
+    Attribute SQL execution time on `engine` to the current request.
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        add_db_time(time.perf_counter() - conn.info["query_started"].pop())
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started"):
+            add_db_time(time.perf_counter() - connection.info["query_started"].pop())
@@ -0,0 +1,80 @@
+import logging
+import math
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default number of jobs a search asks each provider for (the old single-page behaviour)
+DEFAULT_MAX_RESULTS = int(os.getenv("PROVIDER_DEFAULT_MAX_RESULTS", "10"))
+# Page requests in flight per provider search
+PAGE_CONCURRENCY = int(os.getenv("PROVIDER_PAGE_CONCURRENCY", "3"))
+
+# Separate from the provider fan-out pool so a provider task never waits on its own pool
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("PROVIDER_PAGE_WORKERS", "16")), thread_name_prefix="provider-page"
+)
+
+
+def page_count(max_results: int, page_size: int) -> int:
+    return max(1, math.ceil(max_results / page_size))
+
+
+def fetch_pages(
+    fetch_page: Callable[[int], Tuple[int, List[Dict]]],
+    pages: int,
+    page_size: int,
+    concurrency: int = PAGE_CONCURRENCY,
+) -> Iterator[List[Dict]]:
+    """
+    Fetch pages 0..pages-1 with up to `concurrency` requests in flight, yielding each
+    page's normalized jobs in page order.
+
+    fetch_page(index) returns (raw_item_count, normalized_jobs) and should drop the raw
+    response before returning, so only normalized jobs stay in memory. A page with
+    fewer than page_size raw items is the last one: later pages are cancelled.
+    An exception from a page propagates after all earlier pages have been yielded.
+    """
+    in_flight = deque()
+    next_page = 0
+    try:
+        while in_flight or next_page < pages:
+            while next_page < pages and len(in_flight) < concurrency:
+                in_flight.append(_executor.submit(fetch_page, next_page))
+                next_page += 1
+
+            raw_count, jobs = in_flight.popleft().result()
+            yield jobs
+            if raw_count < page_size:
+                return
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+def collect_pages(
+    fetch_page: Callable[[int], Tuple[int, List[Dict]]],
+    pages: int,
+    page_size: int,
+    provider: str,
+) -> List[Dict]:
+    """
+    All jobs from fetch_pages, in page order.
+
+    A failure on the first page propagates, so the caller skips the provider.
+    A failure on a later page (already recorded by the host's breaker) is logged
+    and the jobs from the pages before it are returned.
+    """
+    jobs = []
+    fetched = 0
+    try:
+        for page in fetch_pages(fetch_page, pages, page_size):
+            jobs.extend(page)
+            fetched += 1
+    except Exception as e:
+        if not fetched:
+            raise
+        logger.warning("%s page=%d failed, keeping %d jobs from earlier pages: %s", provider, fetched, len(jobs), e)
+    return jobs
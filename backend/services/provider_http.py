@@ -0,0 +1,101 @@
+import os
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from . import resilience
+
+# Timeouts (seconds) applied to every provider request
+CONNECT_TIMEOUT = float(os.getenv("PROVIDER_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT = float(os.getenv("PROVIDER_READ_TIMEOUT", "10"))
+
+# Retry policy for throttled / failing upstreams
+MAX_RETRIES = int(os.getenv("PROVIDER_MAX_RETRIES", "2"))
+BACKOFF_FACTOR = float(os.getenv("PROVIDER_BACKOFF_FACTOR", "0.5"))
+BACKOFF_JITTER = float(os.getenv("PROVIDER_BACKOFF_JITTER", "0.5"))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Longest Retry-After honoured before a retry; longer waits are cut to this and left to the breaker
+MAX_RETRY_AFTER = float(os.getenv("PROVIDER_MAX_RETRY_AFTER", "5"))
+
+# Send every provider request to this origin instead (e.g. the benchmark fakes);
+# the path and query are kept, and limits/breakers still key on the original host
+BASE_URL_OVERRIDE = os.getenv("PROVIDER_BASE_URL")
+
+# Keep-alive pool sizing: one pool per RapidAPI host, connections per pool
+POOL_HOSTS = int(os.getenv("PROVIDER_POOL_HOSTS", "10"))
+POOL_MAXSIZE = int(os.getenv("PROVIDER_POOL_MAXSIZE", "20"))
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class _CappedRetry(Retry):
+    """
+    Retry whose Retry-After sleep is bounded: urllib3 sleeps for whatever the header
+    says (backoff_max does not apply), which could park a provider thread for an hour.
+    """
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+def _build_session() -> requests.Session:
+    retry = _CappedRetry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=MAX_RETRIES,
+        status=MAX_RETRIES,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET"]),
+        backoff_factor=BACKOFF_FACTOR,
+        backoff_jitter=BACKOFF_JITTER,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide provider session, creating it on first use.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get(url: str, headers: Optional[Dict] = None, params: Optional[Dict] = None, stream: bool = False) -> requests.Response:
+    """
+    GET a provider endpoint over the shared keep-alive pool with timeouts and retries.
+    With stream=True the body is left on the socket; close the response when done.
+    Raises resilience.ProviderUnavailable without calling the host when its circuit
+    is open or its rate limit is exhausted.
+    """
+    parts = urlsplit(url)
+    guard = resilience.get_guard(parts.hostname)
+    guard.before_request()
+    if BASE_URL_OVERRIDE:
+        override = urlsplit(BASE_URL_OVERRIDE)
+        url = urlunsplit((override.scheme, override.netloc, parts.path, parts.query, parts.fragment))
+    try:
+        response = get_session().get(
+            url, headers=headers, params=params, stream=stream, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
+        )
+    except requests.RequestException as e:
+        guard.record_error(e)
+        raise
+    guard.record_response(response.status_code, response.headers)
+    return response
@@ -0,0 +1,173 @@
+import asyncio
+import functools
+import importlib
+import logging
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from . import resilience
+from .metrics import PROVIDER_ERRORS, PROVIDER_RESULTS, PROVIDER_SECONDS
+from .cache import cached_search
+from .job_record import JobRecord, from_dicts
+
+logger = logging.getLogger(__name__)
+
+# Result cache TTLs (seconds); the 24h feeds only refresh every few hours
+CACHE_TTLS = {
+    "linkedin": float(os.getenv("PROVIDER_CACHE_TTL_LINKEDIN", "3600")),
+    "active_jobs": float(os.getenv("PROVIDER_CACHE_TTL_ACTIVE_JOBS", "3600")),
+    "jsearch": float(os.getenv("PROVIDER_CACHE_TTL_JSEARCH", "900")),
+}
+
+# Providers queried for every search, in the order results are reported.
+# Their modules are imported on first use so importing the app stays cheap.
+PROVIDER_NAMES = ("linkedin", "active_jobs", "jsearch")
+
+
+@functools.lru_cache(maxsize=None)
+def _module(name: str):
+    return importlib.import_module(f".{name}", __package__)
+
+
+@functools.lru_cache(maxsize=1)
+def get_providers() -> Dict:
+    """
+    Cached search function per provider, built once per process.
+    """
+    return {
+        name: cached_search(name, CACHE_TTLS[name], from_dicts)(_module(name).search_jobs)
+        for name in PROVIDER_NAMES
+    }
+
+
+def provider_host(name: str) -> str:
+    """
+    Upstream host behind a provider, for rate limit / circuit breaker status.
+    """
+    return _module(name).RAPIDAPI_HOST
+
+# Upper bound on how long a search waits for the slowest provider.
+SEARCH_DEADLINE = float(os.getenv("PROVIDER_SEARCH_DEADLINE", "15"))
+MAX_WORKERS = int(os.getenv("PROVIDER_MAX_WORKERS", "12"))
+
+# Shared across requests so concurrent searches are bounded by one pool.
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="provider")
+
+
+def _timed_search(name: str, search, filters: Dict, kwargs: Dict) -> List[JobRecord]:
+    started = time.perf_counter()
+    try:
+        jobs = search(filters, **kwargs) or []
+    finally:
+        PROVIDER_SECONDS.observe(time.perf_counter() - started, provider=name)
+    PROVIDER_RESULTS.inc(len(jobs), provider=name)
+    return jobs
+
+
+def per_provider_results(max_results: int) -> int:
+    """
+    Share of a search's target result count asked of each provider.
+    """
+    return max(1, math.ceil(max_results / len(PROVIDER_NAMES)))
+
+
+def _submit(filters: Dict, max_results: Optional[int]) -> Dict:
+    kwargs = {"max_results": per_provider_results(max_results)} if max_results else {}
+    return {
+        _executor.submit(_timed_search, name, search, filters, kwargs): name for name, search in get_providers().items()
+    }
+
+
+def _outcome(name: str, future) -> Tuple[str, List[JobRecord], Optional[str]]:
+    try:
+        return name, future.result(), None
+    except resilience.ProviderUnavailable as e:
+        PROVIDER_ERRORS.inc(provider=name, reason="unavailable")
+        logger.warning("Skipping provider=%s: %s", name, e, extra={"provider": name, "reason": "unavailable"})
+        return name, [], str(e)
+    except Exception as e:
+        PROVIDER_ERRORS.inc(provider=name, reason="error")
+        logger.error("Provider=%s failed: %s", name, e, extra={"provider": name, "reason": "error"})
+        return name, [], str(e)
+
+
+def _abandon(futures: Dict, deadline: float):
+    for future, name in futures.items():
+        if not future.done():
+            future.cancel()
+            PROVIDER_ERRORS.inc(provider=name, reason="timeout")
+            logger.warning(
+                "Provider=%s exceeded %ss deadline, skipping", name, deadline,
+                extra={"provider": name, "reason": "timeout"}
+            )
+
+
+def iter_provider_results(
+    filters: Dict, deadline: float = None, max_results: int = None
+) -> Iterator[Tuple[str, List[JobRecord], Optional[str]]]:
+    """
+    Query every provider concurrently and yield (provider, jobs, error) as each one
+    finishes; error is None on success.
+    max_results is the target for the whole search, split evenly across providers.
+    A provider whose circuit is open or that raises yields no jobs; providers still
+    running when the deadline passes are abandoned so they cannot hold up the response.
+    """
+    deadline = SEARCH_DEADLINE if deadline is None else deadline
+    futures = _submit(filters, max_results)
+
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            yield _outcome(futures[future], future)
+    except FuturesTimeout:
+        _abandon(futures, deadline)
+
+
+async def aiter_provider_results(
+    filters: Dict, deadline: float = None, max_results: int = None
+) -> AsyncIterator[Tuple[str, List[JobRecord], Optional[str]]]:
+    """
+    iter_provider_results for async callers: the providers still run on the shared
+    pool, but the waiting request holds no thread of its own.
+    """
+    deadline = SEARCH_DEADLINE if deadline is None else deadline
+    futures = _submit(filters, max_results)
+    waiting = {asyncio.wrap_future(future): future for future in futures}
+    loop = asyncio.get_running_loop()
+    expires_at = loop.time() + deadline
+
+    while waiting:
+        done, _ = await asyncio.wait(
+            waiting, timeout=max(0.0, expires_at - loop.time()), return_when=asyncio.FIRST_COMPLETED
+        )
+        if not done:
+            break
+        for wrapped in done:
+            future = waiting.pop(wrapped)
+            yield _outcome(futures[future], future)
+    _abandon(futures, deadline)
+
+
+def search_all(filters: Dict, deadline: float = None, max_results: int = None) -> List[JobRecord]:
+    """
+    Fan out to all providers and merge their results in completion order.
+    """
+    all_jobs = []
+    for _, jobs, _ in iter_provider_results(filters, deadline, max_results):
+        all_jobs.extend(jobs)
+    return all_jobs
+
+
+async def search_all_async(filters: Dict, deadline: float = None, max_results: int = None) -> List[JobRecord]:
+    all_jobs = []
+    async for _, jobs, _ in aiter_provider_results(filters, deadline, max_results):
+        all_jobs.extend(jobs)
+    return all_jobs
+
+
+def status() -> Dict[str, Dict]:
+    """
+    Circuit breaker state, rate limiter tokens and last-seen RapidAPI quota per provider.
+    """
+    return {name: resilience.get_guard(provider_host(name)).status() for name in PROVIDER_NAMES}
@@ -0,0 +1,125 @@
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .. import models
+
+# Hashed feature space; collisions are rare enough at this size for ranking
+N_FEATURES = 2 ** 18
+
+# Keeps tokens like c++, c#, node.js and ci/cd intact
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+
+_STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the to was we will with you your our "
+    "this their they who what which".split()
+)
+
+
+def _tokens(text: Optional[str]) -> List[str]:
+    words = [w for w in _TOKEN.findall((text or "").lower()) if w not in _STOP_WORDS]
+    # Unigrams plus bigrams so "machine learning" outranks a job mentioning both words apart
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def _feature(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8")) % N_FEATURES
+
+
+def vectorize(weighted_texts: Sequence[Tuple[Optional[str], float]]):
+    """
+    Sublinear-TF hashed feature vector over (text, weight) fields, L2-normalized.
+    Returns (indices, values) as int32 / float32 arrays sorted by index.
+    """
+    counts = Counter()
+    for text, weight in weighted_texts:
+        for token in _tokens(text):
+            counts[_feature(token)] += weight
+
+    if not counts:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+
+    indices = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+    values = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+    order = np.argsort(indices)
+    indices, values = indices[order], values[order].astype(np.float32)
+    values /= np.linalg.norm(values)
+    return indices, values
+
+
+def posting_vector(title: Optional[str], company: Optional[str], description: Optional[str]):
+    return vectorize((
+        (title, 3.0),
+        (company, 1.0),
+        (description, 1.0),
+    ))
+
+
+def job_vector(job: models.Job):
+    return posting_vector(job.title, job.company, job.description)
+
+
+def pack_vector(indices: np.ndarray, values: np.ndarray) -> bytes:
+    return indices.astype(np.int32).tobytes() + values.astype(np.float32).tobytes()
+
+
+def unpack_vector(data: Optional[bytes]):
+    if not data:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+    n = len(data) // 8
+    return np.frombuffer(data, dtype=np.int32, count=n), np.frombuffer(data, dtype=np.float32, count=n, offset=n * 4)
+
+
+def ensure_vectors(jobs: List[models.Job]):
+    """
+    Compute and attach the cached feature vector for jobs that don't have one yet.
+    """
+    for job in jobs:
+        if job.feature_vector is None:
+            job.feature_vector = pack_vector(*job_vector(job))
+
+
+def profile_vector(user_details: Dict) -> np.ndarray:
+    """
+    Dense user vector, so scoring is a single sparse matrix-vector product.
+    """
+    indices, values = vectorize((
+        (user_details.get("skills"), 2.0),
+        (user_details.get("experience"), 1.0),
+    ))
+    dense = np.zeros(N_FEATURES, dtype=np.float32)
+    dense[indices] = values
+    return dense
+
+
+def score_jobs(user_details: Dict, jobs: List[models.Job]) -> np.ndarray:
+    """
+    Cosine similarity of every job against the user's profile.
+    """
+    # scipy is only needed here; importing it lazily keeps app startup fast
+    from scipy import sparse
+
+    if not jobs:
+        return np.empty(0, dtype=np.float32)
+
+    ensure_vectors(jobs)
+    unpacked = [unpack_vector(job.feature_vector) for job in jobs]
+    lengths = np.fromiter((len(indices) for indices, _ in unpacked), dtype=np.int64, count=len(unpacked))
+    indptr = np.concatenate(([0], np.cumsum(lengths)))
+    indices = np.concatenate([indices for indices, _ in unpacked])
+    values = np.concatenate([values for _, values in unpacked])
+
+    matrix = sparse.csr_matrix((values, indices, indptr), shape=(len(jobs), N_FEATURES))
+    return matrix @ profile_vector(user_details)
+
+
+def rank_jobs(user_details: Dict, jobs: List[models.Job]) -> List[models.Job]:
+    """
+    Sort jobs by relevance to the profile, best first; ties keep their original order.
+    """
+    if len(jobs) < 2:
+        return list(jobs)
+    scores = score_jobs(user_details, jobs)
+    return [jobs[i] for i in np.argsort(-scores, kind="stable")]
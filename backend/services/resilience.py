@@ -0,0 +1,218 @@
+import os
+import threading
+import time
+from typing import Dict
+
+# Circuit breaker defaults, shared by every provider host
+FAILURE_THRESHOLD = int(os.getenv("PROVIDER_BREAKER_FAILURES", "3"))
+RESET_TIMEOUT = float(os.getenv("PROVIDER_BREAKER_RESET", "60"))
+# Longest a request waits for a rate-limit token before the provider is skipped
+RATE_LIMIT_MAX_WAIT = float(os.getenv("PROVIDER_RATE_LIMIT_MAX_WAIT", "1"))
+# Default plan when a host has not been configured
+DEFAULT_RATE_PER_MINUTE = float(os.getenv("PROVIDER_RATE_PER_MINUTE", "60"))
+DEFAULT_BURST = float(os.getenv("PROVIDER_RATE_BURST", "10"))
+
+# Upstream statuses that mean the host (or our key) is unusable right now
+FAILURE_STATUSES = {401, 403, 429}
+
+# RapidAPI reports the plan's remaining quota on every response
+QUOTA_HEADERS = {
+    "x-ratelimit-requests-limit": "requests_limit",
+    "x-ratelimit-requests-remaining": "requests_remaining",
+    "x-ratelimit-requests-reset": "requests_reset",
+}
+
+
+class ProviderUnavailable(Exception):
+    """
+    Raised instead of calling a provider host that is known to be unusable.
+    """
+
+    def __init__(self, host: str, reason: str):
+        super().__init__(f"{host} unavailable: {reason}")
+        self.host = host
+        self.reason = reason
+
+
+class CircuitOpen(ProviderUnavailable):
+    pass
+
+
+class RateLimited(ProviderUnavailable):
+    pass
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at `rate` tokens per second.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout: float = 0.0) -> bool:
+        """
+        Take one token, waiting up to `timeout` seconds for one to become free.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate if self.rate > 0 else float("inf")
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker. After `failure_threshold` consecutive failures
+    the circuit opens and calls are refused for `reset_timeout` seconds; then a
+    single probe is let through and its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.last_error = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    return False
+                self._probing = True
+            return True
+
+    def release(self):
+        """
+        Give back a half-open probe slot that was claimed but never used.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self, error: str):
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            retry_in = 0.0
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "retry_in": round(retry_in, 1),
+                "last_error": self.last_error,
+            }
+
+
+class HostGuard:
+    """
+    Rate limiter, circuit breaker and last-seen upstream quota for one provider host.
+    """
+
+    def __init__(self, host: str, rate_per_minute: float = DEFAULT_RATE_PER_MINUTE, burst: float = DEFAULT_BURST):
+        self.host = host
+        self.bucket = TokenBucket(rate_per_minute / 60.0, burst)
+        self.breaker = CircuitBreaker()
+        self.quota = {}
+
+    def before_request(self):
+        if not self.breaker.allow():
+            raise CircuitOpen(self.host, "circuit open")
+        if not self.bucket.acquire(RATE_LIMIT_MAX_WAIT):
+            self.breaker.release()
+            raise RateLimited(self.host, "rate limit reached")
+
+    def record_response(self, status_code: int, headers):
+        for header, key in QUOTA_HEADERS.items():
+            if header in headers:
+                self.quota[key] = headers[header]
+        if status_code >= 500 or status_code in FAILURE_STATUSES:
+            self.breaker.record_failure(f"HTTP {status_code}")
+        else:
+            self.breaker.record_success()
+
+    def record_error(self, error: Exception):
+        self.breaker.record_failure(f"{type(error).__name__}: {error}")
+
+    def status(self) -> Dict:
+        return {
+            "host": self.host,
+            "circuit": self.breaker.snapshot(),
+            "rate_limit": {
+                "per_minute": round(self.bucket.rate * 60, 2),
+                "burst": self.bucket.capacity,
+                "tokens_available": round(self.bucket.available(), 2),
+            },
+            "quota": dict(self.quota),
+        }
+
+
+_guards: Dict[str, HostGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def configure_host(host: str, env_prefix: str) -> HostGuard:
+    """
+    Size a host's token bucket to its plan, read from <env_prefix>_RATE_PER_MINUTE
+    and <env_prefix>_RATE_BURST.
+    """
+    guard = HostGuard(
+        host,
+        rate_per_minute=float(os.getenv(f"{env_prefix}_RATE_PER_MINUTE", DEFAULT_RATE_PER_MINUTE)),
+        burst=float(os.getenv(f"{env_prefix}_RATE_BURST", DEFAULT_BURST)),
+    )
+    with _guards_lock:
+        _guards[host] = guard
+    return guard
+
+
+def get_guard(host: str) -> HostGuard:
+    with _guards_lock:
+        if host not in _guards:
+            _guards[host] = HostGuard(host)
+        return _guards[host]
@@ -0,0 +1,138 @@
+import logging
+import re
+from typing import List
+from sqlalchemy import text, or_
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from .. import models
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# SQLite: external-content FTS5 table over jobs, kept current by triggers
+_SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, company, location, description,
+        content='jobs', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, company, location, description)
+        VALUES (new.id, new.title, new.company, new.location, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+        VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, company, location, description ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+        VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+        INSERT INTO jobs_fts(rowid, title, company, location, description)
+        VALUES (new.id, new.title, new.company, new.location, new.description);
+    END
+    """,
+]
+
+# Postgres: expression GIN index; the search query repeats the same expression so it is used
+_PG_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(jobs.title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(jobs.company, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(jobs.location, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(jobs.description, '')), 'D')"
+)
+_PG_DDL = [f"CREATE INDEX IF NOT EXISTS ix_jobs_fulltext ON jobs USING GIN (({_PG_DOCUMENT}))"]
+
+# Only canonical jobs (or legacy rows not yet resolved) are searchable
+_CANONICAL = "(jobs.canonical_job_id IS NULL OR jobs.canonical_job_id = jobs.id)"
+
+_fts_available = {}
+
+
+def ensure_search_index(engine: Engine):
+    """
+    Create the full-text index and its maintenance triggers if missing.
+    """
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        try:
+            with engine.begin() as conn:
+                fresh = conn.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+                )).first() is None
+                for ddl in _SQLITE_DDL:
+                    conn.execute(text(ddl))
+                if fresh:
+                    # Index jobs stored before the FTS table existed
+                    conn.execute(text("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')"))
+            _fts_available[dialect] = True
+        except OperationalError as e:
+            logger.warning("SQLite FTS5 unavailable, local search falls back to LIKE: %s", e)
+            _fts_available[dialect] = False
+    elif dialect == "postgresql":
+        with engine.begin() as conn:
+            for ddl in _PG_DDL:
+                conn.execute(text(ddl))
+        _fts_available[dialect] = True
+
+
+def _tokens(query: str) -> List[str]:
+    return _TOKEN.findall(query or "")
+
+
+def search(db: Session, query: str, limit: int = 20, offset: int = 0) -> List[models.Job]:
+    """
+    Ranked full-text search over stored jobs, best matches first.
+    """
+    tokens = _tokens(query)
+    if not tokens:
+        return []
+
+    dialect = db.get_bind().dialect.name
+    params = {"limit": limit, "offset": offset}
+
+    if dialect == "sqlite" and _fts_available.get(dialect):
+        # Quote every token (FTS5 syntax is not user input) and prefix-match it
+        params["match"] = " ".join('"{}"*'.format(t.replace('"', '')) for t in tokens)
+        stmt = text(
+            "SELECT jobs.id FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid "
+            f"WHERE jobs_fts MATCH :match AND {_CANONICAL} "
+            "ORDER BY bm25(jobs_fts, 10.0, 5.0, 3.0, 1.0) LIMIT :limit OFFSET :offset"
+        )
+    elif dialect == "postgresql":
+        params["query"] = " ".join(tokens)
+        stmt = text(
+            f"SELECT jobs.id FROM jobs, websearch_to_tsquery('english', :query) AS q "
+            f"WHERE ({_PG_DOCUMENT}) @@ q AND {_CANONICAL} "
+            f"ORDER BY ts_rank_cd({_PG_DOCUMENT}, q) DESC, jobs.id DESC LIMIT :limit OFFSET :offset"
+        )
+    else:
+        return _like_search(db, tokens, limit, offset)
+
+    ids = [job_id for (job_id,) in db.execute(stmt, params)]
+    if not ids:
+        return []
+    by_id = {job.id: job for job in db.query(models.Job).filter(models.Job.id.in_(ids))}
+    return [by_id[job_id] for job_id in ids if job_id in by_id]
+
+
+def _like_search(db: Session, tokens: List[str], limit: int, offset: int) -> List[models.Job]:
+    q = db.query(models.Job).filter(
+        or_(models.Job.canonical_job_id.is_(None), models.Job.canonical_job_id == models.Job.id)
+    )
+    for token in tokens:
+        pattern = f"%{token}%"
+        q = q.filter(or_(
+            models.Job.title.ilike(pattern),
+            models.Job.company.ilike(pattern),
+            models.Job.location.ilike(pattern),
+            models.Job.description.ilike(pattern),
+        ))
+    return q.order_by(models.Job.id.desc()).offset(offset).limit(limit).all()
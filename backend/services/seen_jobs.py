@@ -0,0 +1,128 @@
+import os
+from datetime import datetime
+from typing import Iterable
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
+from .. import models
+from .cache import get_cache
+
+SEEN = "seen"
+APPLIED = "applied"
+DISMISSED = "dismissed"
+STATES = (SEEN, APPLIED, DISMISSED)
+
+# Users whose job sets are kept in memory; each costs about max(job id) / 8 bytes per state
+SEEN_FILTER_MAXSIZE = int(os.getenv("SEEN_FILTER_MAXSIZE", "256"))
+# Reload from the table after this long, to pick up writes made by other processes
+SEEN_FILTER_TTL = float(os.getenv("SEEN_FILTER_TTL", "300"))
+
+# Keep each multi-row INSERT well under SQLite's bound-parameter limit
+CHUNK_SIZE = 200
+
+_DIALECT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+class JobBitmap:
+    """
+    Set of job ids as a bitmap indexed by Job.id: O(1) membership, one bit per id.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, job_ids: Iterable[int] = ()):
+        self._bits = bytearray()
+        for job_id in job_ids:
+            self.add(job_id)
+
+    def add(self, job_id: int):
+        index = job_id >> 3
+        if index >= len(self._bits):
+            # Grow geometrically so a run of new, increasing ids is amortized O(1)
+            self._bits.extend(bytes(max(index + 1 - len(self._bits), len(self._bits))))
+        self._bits[index] |= 1 << (job_id & 7)
+
+    def __contains__(self, job_id: int) -> bool:
+        index = job_id >> 3
+        return index < len(self._bits) and bool(self._bits[index] >> (job_id & 7) & 1)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class UserJobs:
+    """
+    One user's job states: `seen` (returned by a search) and `hidden` (applied to or dismissed).
+    """
+
+    __slots__ = ("seen", "hidden")
+
+    def __init__(self):
+        self.seen = JobBitmap()
+        self.hidden = JobBitmap()
+
+    def add(self, job_id: int, state: str):
+        (self.seen if state == SEEN else self.hidden).add(job_id)
+
+    def excludes(self, job_id: int, include_seen: bool = False) -> bool:
+        return job_id in self.hidden or (not include_seen and job_id in self.seen)
+
+
+_cache = get_cache("seen_jobs", SEEN_FILTER_TTL, maxsize=SEEN_FILTER_MAXSIZE, shared=False)
+
+
+def for_user(db: Session, user_id: int) -> UserJobs:
+    """
+    The user's job states, read from job_interactions once and then kept in memory.
+    """
+    key = str(user_id)
+    user_jobs = _cache.get(key)
+    if user_jobs is None:
+        user_jobs = UserJobs()
+        rows = db.query(models.JobInteraction.job_id, models.JobInteraction.state).filter(
+            models.JobInteraction.user_id == user_id
+        )
+        for job_id, state in rows:
+            user_jobs.add(job_id, state)
+        _cache.set(key, user_jobs)
+    return user_jobs
+
+
+def record(db: Session, user_id: int, job_ids: Iterable[int], state: str):
+    """
+    Store a state for jobs (idempotent) and update the in-memory set if it is loaded.
+    The caller commits.
+    """
+    job_ids = list(dict.fromkeys(job_ids))
+    if not job_ids:
+        return
+    if state not in STATES:
+        raise ValueError(f"Unknown job state: {state}")
+
+    now = datetime.utcnow()
+    rows = [{"user_id": user_id, "job_id": job_id, "state": state, "created_at": now} for job_id in job_ids]
+    insert = _DIALECT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        for start in range(0, len(rows), CHUNK_SIZE):
+            stmt = insert(models.JobInteraction).values(rows[start:start + CHUNK_SIZE]).on_conflict_do_nothing(
+                index_elements=["user_id", "job_id", "state"]
+            )
+            db.execute(stmt)
+    else:
+        existing = {
+            job_id for (job_id,) in db.query(models.JobInteraction.job_id).filter(
+                models.JobInteraction.user_id == user_id,
+                models.JobInteraction.state == state,
+                models.JobInteraction.job_id.in_(job_ids),
+            )
+        }
+        db.add_all(models.JobInteraction(**row) for row in rows if row["job_id"] not in existing)
+
+    user_jobs = _cache.get(str(user_id))
+    if user_jobs is not None:
+        for job_id in job_ids:
+            user_jobs.add(job_id, state)
+
@@ -1,10 +1,98 @@
 import re
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+# The same address split around the "@", so a scan only runs the regex where an "@" is
+_LOCAL_PART = re.compile(r'[a-zA-Z0-9._%+-]+\Z')
+_DOMAIN = re.compile(r'[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_MAX_LOCAL_PART = 64
+
+# "name [at] company [dot] com", "name (at) company (dot) com", "name {AT} ..."
+_OBFUSCATION = re.compile(r'[\[\(\{<]\s*([aA][tT]|[dD][oO][tT])\s*[\]\)\}>]')
+_WHITESPACE = re.compile(r'\s*')
+
+# Mailboxes worth writing to, best first; matched against the local part
+_PREFERRED_MAILBOXES = re.compile(r'^(hr|careers?|jobs?|recruit\w*|talent\w*|hiring|apply|people)\b', re.IGNORECASE)
+_UNMONITORED_MAILBOXES = re.compile(r'^(no-?reply|do-?not-?reply|mailer-daemon|bounce)', re.IGNORECASE)
+
+# Joins a batch into one string for a single scan; contains no email characters
+_SEPARATOR = "\n\x00\n"
+
+
+def deobfuscate(text: str) -> str:
+    """Rewrites obfuscated addresses such as `name [at] company [dot] com`."""
+    parts = []
+    last = 0
+    for match in _OBFUSCATION.finditer(text):
+        parts.append(text[last:match.start()].rstrip())
+        parts.append("@" if len(match.group(1)) == 2 else ".")
+        last = _WHITESPACE.match(text, match.end()).end()
+    if not parts:
+        return text
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def _scan(text: str) -> Iterator[Tuple[int, str]]:
+    """Yields (start, address) for every address in text, matching EMAIL_PATTERN."""
+    floor = 0
+    at = text.find("@")
+    while at != -1:
+        local = _LOCAL_PART.search(text, max(floor, at - _MAX_LOCAL_PART), at)
+        domain = _DOMAIN.match(text, at + 1) if local else None
+        if domain:
+            yield local.start(), text[local.start():domain.end()]
+            floor = domain.end()
+            at = text.find("@", floor)
+        else:
+            at = text.find("@", at + 1)
+
+
+def _rank(address: str) -> int:
+    local_part = address.split("@", 1)[0]
+    if _PREFERRED_MAILBOXES.match(local_part):
+        return 0
+    if _UNMONITORED_MAILBOXES.match(local_part):
+        return 2
+    return 1
+
+
+def rank_emails(addresses: Iterable[str]) -> List[str]:
+    """
+    Unique addresses ordered HR/careers/recruiting first and noreply last,
+    keeping the order they appeared in otherwise.
+    """
+    unique = {}
+    for address in addresses:
+        unique.setdefault(address.lower(), address)
+    return sorted(unique.values(), key=_rank)
+
+
+def extract_emails_bulk(texts: Iterable[Optional[str]]) -> List[List[str]]:
+    """
+    Candidate addresses for each text, ranked, from a single scan over the batch.
+    """
+    texts = [deobfuscate(text) if text else "" for text in texts]
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + len(_SEPARATOR)
+
+    found = [[] for _ in texts]
+    for start, address in _scan(_SEPARATOR.join(texts)):
+        found[bisect_right(starts, start) - 1].append(address)
+    return [rank_emails(addresses) if addresses else [] for addresses in found]
+
+
+def best_emails(texts: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """The best-ranked address for each text in a batch, or None."""
+    return [addresses[0] if addresses else None for addresses in extract_emails_bulk(texts)]
 
 
 def extract_email(text: str) -> str:
-    """Extracts the first email address found in the text."""
+    """Extracts the best-ranked email address found in the text."""
     if not text:
         return None
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    match = re.search(email_pattern, text)
-    return match.group(0) if match else None
\ No newline at end of file
+    return best_emails([text])[0]
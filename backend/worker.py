@@ -0,0 +1,43 @@
+"""
+Standalone ingestion worker, for running the scheduler outside the web processes:
+
+    python -m backend.worker          # run forever, every INGESTION_INTERVAL seconds
+    python -m backend.worker --once   # single run, e.g. from cron
+"""
+import argparse
+import logging
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+from .database import init_db
+from .logging_config import configure_logging
+from .services.ingestion import IngestionScheduler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-warm the job store from all user profiles.")
+    parser.add_argument("--once", action="store_true", help="run a single ingestion pass and exit")
+    args = parser.parse_args()
+
+    configure_logging()
+    init_db()
+    scheduler = IngestionScheduler()
+
+    if args.once:
+        counts = scheduler.run_once()
+        logging.getLogger(__name__).info(
+            "Ingestion run stored %d jobs for %d queries", sum(counts.values()), len(counts)
+        )
+        return
+
+    scheduler.start()
+    try:
+        scheduler.join()
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+
+if __name__ == "__main__":
+    main()
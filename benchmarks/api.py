@@ -0,0 +1,198 @@
+"""
+End-to-end API benchmark against local fakes; no paid service is called.
+
+    python -m benchmarks.api [--requests 50] [--concurrency 4] [--provider-latency-ms 80]
+                             [--error-rate 0.05] [--gemini-latency-ms 300] [--cold]
+
+Starts the fake RapidAPI providers and SMTP sink, points the app at them through
+PROVIDER_BASE_URL / SMTP_*, swaps in the stub Gemini model and drives the FastAPI app
+with TestClient. Reports p50/p95/p99 latency, throughput, DB queries and bytes on the
+wire (after compression) per request for each endpoint.
+"""
+import argparse
+import math
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from .fakes import FakeProviderServer, SMTPSink, StubGeminiModel
+
+ENDPOINTS = ["search", "search_stream", "local_search", "apply", "applications"]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class QueryCounter:
+    def __init__(self, *engines):
+        from sqlalchemy import event
+        self.count = 0
+        self._lock = threading.Lock()
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        with self._lock:
+            self.count += 1
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50, help="requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=ENDPOINTS)
+    parser.add_argument("--provider-latency-ms", type=float, default=80)
+    parser.add_argument("--provider-jitter-ms", type=float, default=40)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of provider requests answered with 503")
+    parser.add_argument("--provider-items", type=int, default=50, help="postings each provider has per query")
+    parser.add_argument("--provider-rate-per-minute", type=float, default=1e6,
+                        help="token bucket per provider; the default effectively disables it")
+    parser.add_argument("--gemini-latency-ms", type=float, default=300)
+    parser.add_argument("--max-results", type=int, default=30)
+    parser.add_argument("--cold", action="store_true", help="clear the provider result cache before every search")
+    parser.add_argument("--database-url", help="defaults to a throwaway SQLite file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    providers_fake = FakeProviderServer(
+        latency=args.provider_latency_ms / 1000,
+        jitter=args.provider_jitter_ms / 1000,
+        error_rate=args.error_rate,
+        total_items=args.provider_items,
+    ).start()
+    smtp_sink = SMTPSink().start()
+    gemini_stub = StubGeminiModel(latency=args.gemini_latency_ms / 1000)
+
+    # Configuration is read at import time, so set it before importing the app
+    workdir = tempfile.mkdtemp(prefix="jobsearch-bench-")
+    os.environ.update({
+        "DATABASE_URL": args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        "PROVIDER_BASE_URL": providers_fake.base_url,
+        "SMTP_SERVER": "127.0.0.1",
+        "SMTP_PORT": str(smtp_sink.port),
+        "SMTP_USER": "benchmark@example.com",
+        "SMTP_PASSWORD": "benchmark",
+        "SMTP_USE_TLS": "false",
+        "GEMINI_API_KEY": "benchmark",
+        "INGESTION_ENABLED": "false",
+    })
+    for prefix in ("LINKEDIN", "ACTIVE_JOBS", "JSEARCH"):
+        os.environ[f"{prefix}_RATE_PER_MINUTE"] = str(args.provider_rate_per_minute)
+        os.environ[f"{prefix}_RATE_BURST"] = str(max(1.0, args.provider_rate_per_minute / 60))
+
+    from fastapi.testclient import TestClient
+    from backend import models
+    from backend.database import SessionLocal, async_engine, engine
+    from backend.main import app
+    from backend.services import gemini, providers
+
+    gemini.get_model = lambda: gemini_stub
+    queries = QueryCounter(engine, *([async_engine.sync_engine] if async_engine is not None else []))
+
+    def clear_provider_cache():
+        if args.cold:
+            for search in providers.get_providers().values():
+                search.cache.clear()
+
+    with TestClient(app) as client:
+        # The schema is created on startup, so seed inside the client context
+        db = SessionLocal()
+        user = models.User(
+            name="Bench User", email="bench.user@example.com", skills="Python, FastAPI, PostgreSQL",
+            experience="5 years building backend services", location="Remote"
+        )
+        db.add(user)
+        db.commit()
+        user_id = user.id
+        db.close()
+
+        # Fill the job store so local search and apply have something to work on
+        client.get("/jobs/search", params={"user_id": user_id, "max_results": args.max_results})
+        db = SessionLocal()
+        job_ids = [job_id for (job_id,) in db.query(models.Job.id).filter(models.Job.hr_email.isnot(None))]
+        db.close()
+        next_job = count()
+
+        # include_seen: the seeding search above already marked every job as seen
+        search_params = {"user_id": user_id, "max_results": args.max_results, "include_seen": True}
+
+        def search():
+            clear_provider_cache()
+            return client.get("/jobs/search", params=search_params)
+
+        def search_stream():
+            clear_provider_cache()
+            response = client.get("/jobs/search/stream", params=search_params)
+            response.read()
+            return response
+
+        def local_search():
+            return client.get("/jobs/local-search", params={"q": "python engineer"})
+
+        def apply():
+            job_id = job_ids[next(next_job) % len(job_ids)]
+            return client.post("/apply/", params={"user_id": user_id}, json={"job_id": job_id})
+
+        def applications():
+            return client.get(f"/applications/{user_id}")
+
+        scenarios = {
+            "search": search,
+            "search_stream": search_stream,
+            "local_search": local_search,
+            "apply": apply,
+            "applications": applications,
+        }
+
+        print(
+            f"{'endpoint':<14} {'n':>5} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+            f"{'max ms':>9} {'req/s':>8} {'queries/req':>12} {'kB/req':>8}"
+        )
+        for name in args.endpoints:
+            run = scenarios[name]
+            latencies = []
+            errors = 0
+            wire_bytes = 0
+            lock = threading.Lock()
+
+            def timed(_):
+                nonlocal errors, wire_bytes
+                started = time.perf_counter()
+                response = run()
+                elapsed = (time.perf_counter() - started) * 1000
+                with lock:
+                    latencies.append(elapsed)
+                    wire_bytes += response.num_bytes_downloaded
+                    if response.status_code >= 400:
+                        errors += 1
+
+            queries_before = queries.count
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                list(pool.map(timed, range(args.requests)))
+            wall = time.perf_counter() - started
+
+            print(
+                f"{name:<14} {len(latencies):>5} {errors:>6} {percentile(latencies, 50):>9.1f} "
+                f"{percentile(latencies, 95):>9.1f} {percentile(latencies, 99):>9.1f} {max(latencies):>9.1f} "
+                f"{len(latencies) / wall:>8.1f} {(queries.count - queries_before) / len(latencies):>12.1f} "
+                f"{wire_bytes / 1024 / len(latencies):>8.1f}"
+            )
+
+    print(
+        f"\nfake providers: {providers_fake.requests} requests, {providers_fake.errors} injected errors; "
+        f"gemini stub: {gemini_stub.calls} calls; smtp sink: {smtp_sink.messages} messages"
+    )
+    providers_fake.stop()
+    smtp_sink.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Throughput of contact extraction over provider-sized job descriptions.
+
+    python -m benchmarks.email_extraction [--count 50000]
+
+Compares the old per-description lookup (a pattern string passed to re.search,
+first match only) with the batched extractor used by the provider adapters.
+"""
+import argparse
+import random
+import re
+import time
+from backend.services import utils
+
+_LEGACY_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+
+_FILLER = (
+    "We are looking for an engineer to build and operate distributed services. "
+    "You will work with Python, SQL and cloud infrastructure in a small team. "
+)
+_CONTACTS = [
+    "",
+    " Send your CV to careers@example.com.",
+    " Questions: noreply@example.com; applications to hr@example.org.",
+    " Reach the hiring manager at jane [at] example [dot] com.",
+    " Support: support@example.net",
+]
+
+
+def legacy_extract(text):
+    if not text:
+        return None
+    match = re.search(_LEGACY_PATTERN, text)
+    return match.group(0) if match else None
+
+
+def make_descriptions(count, seed=0):
+    rng = random.Random(seed)
+    return [_FILLER * rng.randint(5, 30) + rng.choice(_CONTACTS) for _ in range(count)]
+
+
+def _measure(label, fn, descriptions, megabytes):
+    started = time.perf_counter()
+    found = fn(descriptions)
+    elapsed = time.perf_counter() - started
+    hits = sum(1 for email in found if email)
+    print(
+        f"{label:<28} {elapsed * 1000:9.1f} ms  {len(descriptions) / elapsed:12,.0f} desc/s  "
+        f"{megabytes / elapsed:7.1f} MB/s  {hits:,} with contact"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--batch", type=int, default=100, help="descriptions per batch (a provider page)")
+    args = parser.parse_args()
+
+    descriptions = make_descriptions(args.count)
+    megabytes = sum(len(d) for d in descriptions) / 1e6
+    print(f"{args.count:,} descriptions, {megabytes:.1f} MB")
+
+    _measure("per-description (legacy)", lambda ds: [legacy_extract(d) for d in ds], descriptions, megabytes)
+
+    def batched(ds):
+        found = []
+        for start in range(0, len(ds), args.batch):
+            found.extend(utils.best_emails(ds[start:start + args.batch]))
+        return found
+
+    _measure(f"batched ({args.batch}/batch)", batched, descriptions, megabytes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Local stand-ins for the paid services the API calls: RapidAPI providers, Gemini and SMTP.
+"""
+import asyncio
+import json
+import random
+import socketserver
+import threading
+import time
+from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Provider endpoint path -> (recorded payload, id field, paging style)
+PROVIDER_ROUTES = {
+    "/active-jb-24h": ("linkedin.json", "id", "offset"),
+    "/active-ats-24h": ("active_jobs.json", "id", "offset"),
+    "/search": ("jsearch.json", "job_id", "page"),
+}
+
+
+class FakeProviderServer:
+    """
+    Replays the recorded provider payloads in benchmarks/fixtures over HTTP.
+
+    Every page is the recorded list with ids stamped by position, so paging yields
+    distinct postings until `total_items` have been served (then a short page).
+    Each request waits `latency` seconds (plus up to `jitter`) and fails with a 503
+    with probability `error_rate`.
+    """
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.02, error_rate: float = 0.0,
+                 total_items: int = 50, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.total_items = total_items
+        self.requests = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._payloads = {
+            path: json.loads((FIXTURES_DIR / name).read_text())
+            for path, (name, _, _) in PROVIDER_ROUTES.items()
+        }
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def _page(self, path: str, query: dict):
+        name, id_field, paging = PROVIDER_ROUTES[path]
+        payload = deepcopy(self._payloads[path])
+        items = payload if isinstance(payload, list) else payload["data"]
+        if paging == "offset":
+            start = int(query.get("offset", ["0"])[0])
+        else:
+            start = (int(query.get("page", ["1"])[0]) - 1) * len(items)
+
+        page = []
+        for index, item in enumerate(items[:max(0, self.total_items - start)]):
+            item[id_field] = f"{item[id_field]}-{start + index}"
+            page.append(item)
+        if isinstance(payload, list):
+            return page
+        payload["data"] = page
+        return payload
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                with fake._lock:
+                    fake.requests += 1
+                    delay = fake.latency + fake._rng.random() * fake.jitter
+                    failed = fake._rng.random() < fake.error_rate
+                    if failed:
+                        fake.errors += 1
+                time.sleep(delay)
+
+                if parts.path not in PROVIDER_ROUTES:
+                    status, body = 404, b'{"message": "not found"}'
+                elif failed:
+                    status, body = 503, b'{"message": "injected failure"}'
+                else:
+                    status, body = 200, json.dumps(fake._page(parts.path, parse_qs(parts.query))).encode()
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("x-ratelimit-requests-remaining", "999")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-providers", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class SMTPSink:
+    """
+    Minimal SMTP server that accepts AUTH, NOOP and any message and discards it.
+    """
+
+    def __init__(self):
+        self.messages = 0
+        sink = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line: str):
+                self.wfile.write(f"{line}\r\n".encode())
+
+            def handle(self):
+                self.reply("220 localhost benchmark sink")
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return
+                    command = line.decode(errors="replace").strip().upper()
+                    if command.startswith(("EHLO", "HELO")):
+                        self.reply("250-localhost")
+                        self.reply("250 AUTH PLAIN LOGIN")
+                    elif command.startswith("AUTH"):
+                        self.reply("235 2.7.0 Authentication successful")
+                    elif command.startswith("DATA"):
+                        self.reply("354 End data with <CR><LF>.<CR><LF>")
+                        while self.rfile.readline() not in (b".\r\n", b".\n", b""):
+                            pass
+                        sink.messages += 1
+                        self.reply("250 OK")
+                    elif command.startswith("QUIT"):
+                        self.reply("221 Bye")
+                        return
+                    else:
+                        # MAIL, RCPT, RSET, NOOP
+                        self.reply("250 OK")
+
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, name="smtp-sink", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _StubResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class StubGeminiModel:
+    """
+    Drop-in for genai.GenerativeModel with a fixed latency and canned answers:
+    filter JSON for the search-filter prompt, an email body otherwise.
+    """
+
+    FILTERS = {"title_filter": "Software Engineer", "location_filter": "Remote", "description_filter": "Python"}
+    EMAIL = "Dear hiring team,\n\nI am excited to apply for this role. My resume is attached.\n\nBest regards"
+
+    def __init__(self, latency: float = 0.3):
+        self.latency = latency
+        self.calls = 0
+
+    def _answer(self, prompt: str) -> _StubResponse:
+        self.calls += 1
+        return _StubResponse(json.dumps(self.FILTERS) if "title_filter" in prompt else self.EMAIL)
+
+    def generate_content(self, prompt: str) -> _StubResponse:
+        time.sleep(self.latency)
+        return self._answer(prompt)
+
+    async def generate_content_async(self, prompt: str) -> _StubResponse:
+        await asyncio.sleep(self.latency)
+        return self._answer(prompt)
@@ -0,0 +1,92 @@
+"""
+Import and startup time budget for the API process.
+
+    python -m benchmarks.startup [--runs 5] [--import-budget-ms 1400] [--startup-budget-ms 600]
+
+Each run is a fresh interpreter against a throwaway SQLite file, like a cold
+uvicorn worker or serverless instance. It measures `import backend.main` and the
+lifespan startup (migrations, search index, queue resume), and checks that the
+import itself is side-effect free: it must not load the Gemini SDK or scipy and
+must not create the database. Exits non-zero when a median exceeds its budget or
+a check fails, so it can guard the budget in CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must only load on first use, not when the app is imported
+LAZY_MODULES = ["google.generativeai", "scipy", "alembic"]
+
+_CHILD = """
+import json, os, sys, time
+started = time.perf_counter()
+import backend.main
+imported = time.perf_counter()
+lazy_loaded = [name for name in {lazy!r} if name in sys.modules]
+db_created = os.path.exists({db_path!r})
+from fastapi.testclient import TestClient
+ready = time.perf_counter()
+with TestClient(backend.main.app):
+    started_up = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (started_up - ready) * 1000,
+    "lazy_loaded": lazy_loaded,
+    "db_created": db_created,
+}}))
+"""
+
+
+def measure_once(workdir: str, run: int) -> dict:
+    db_path = os.path.join(workdir, f"startup-{run}.db")
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}", INGESTION_ENABLED="false", LOG_LEVEL="WARNING")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(lazy=LAZY_MODULES, db_path=db_path)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=1400)
+    parser.add_argument("--startup-budget-ms", type=float, default=600)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="jobsearch-startup-") as workdir:
+        runs = [measure_once(workdir, run) for run in range(args.runs)]
+
+    failures = []
+    print(f"{'phase':<10} {'median ms':>10} {'min ms':>9} {'max ms':>9} {'budget ms':>10}")
+    for phase, budget in (("import", args.import_budget_ms), ("startup", args.startup_budget_ms)):
+        samples = [run[f"{phase}_ms"] for run in runs]
+        median = statistics.median(samples)
+        print(f"{phase:<10} {median:>10.1f} {min(samples):>9.1f} {max(samples):>9.1f} {budget:>10.0f}")
+        if median > budget:
+            failures.append(f"{phase} median {median:.1f} ms exceeds the {budget:.0f} ms budget")
+
+    lazy_loaded = sorted({name for run in runs for name in run["lazy_loaded"]})
+    if lazy_loaded:
+        failures.append(f"importing the app loaded {', '.join(lazy_loaded)}")
+    if any(run["db_created"] for run in runs):
+        failures.append("importing the app created the database")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -112,6 +112,28 @@ window.addEventListener('load', () => {
 
 
 
+function renderJobCard(job) {
+    const card = document.createElement('div');
+    card.className = 'job-card';
+    card.innerHTML = `
+        <div class="job-title">${job.title}</div>
+        <div class="job-company">${job.company}</div>
+        <div class="job-location">${job.location}</div>
+        <p style="font-size: 0.9rem; color: #cbd5e1; margin-bottom: 1rem; flex-grow: 1;">
+            ${job.description.substring(0, 100)}...
+        </p>
+        <div style="display: flex; gap: 0.5rem; flex-wrap: wrap;">
+
+        </div>
+        ${job.hr_email ?
+            `<button onclick="applyForJob(${job.id})" class="primary-btn">Easy Apply with AI</button>` :
+            `<a href="${job.url}" target="_blank" class="primary-btn" style="text-decoration: none; text-align: center; display: block;">Apply Manually</a>`
+        }
+    `;
+    return card;
+}
+
+
 async function searchJobs() {
     const query = document.getElementById('job-query').value;
     const location = document.getElementById('job-location').value;
@@ -127,42 +149,44 @@ async function searchJobs() {
     container.innerHTML = '';
 
     try {
-        let url = `${API_BASE_URL}/jobs/search?query=${encodeURIComponent(query)}&location=${encodeURIComponent(location)}`;
+        // Streamed search: each provider's jobs arrive as one NDJSON line
+        let url = `${API_BASE_URL}/jobs/search/stream?query=${encodeURIComponent(query)}&location=${encodeURIComponent(location)}`;
         if (currentUser && currentUser.id) {
             url += `&user_id=${currentUser.id}`;
         }
 
         const response = await fetch(url);
-        const jobs = await response.json();
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffered = '';
+        let total = 0;
+
+        const handleEvent = (line) => {
+            if (!line.trim()) return;
+            const event = JSON.parse(line);
+            if (event.event === 'jobs' && event.jobs.length > 0) {
+                loading.classList.add('hidden');
+                event.jobs.forEach(job => container.appendChild(renderJobCard(job)));
+                total += event.jobs.length;
+            }
+        };
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffered += decoder.decode(value, { stream: true });
+            const lines = buffered.split('\n');
+            buffered = lines.pop();
+            lines.forEach(handleEvent);
+        }
+        handleEvent(buffered);
 
         loading.classList.add('hidden');
 
-        if (jobs.length === 0) {
+        if (total === 0) {
             container.innerHTML = '<p style="grid-column: 1/-1; text-align: center;">No jobs found.</p>';
-            return;
         }
 
-        jobs.forEach(job => {
-            const card = document.createElement('div');
-            card.className = 'job-card';
-            card.innerHTML = `
-                <div class="job-title">${job.title}</div>
-                <div class="job-company">${job.company}</div>
-                <div class="job-location">${job.location}</div>
-                <p style="font-size: 0.9rem; color: #cbd5e1; margin-bottom: 1rem; flex-grow: 1;">
-                    ${job.description.substring(0, 100)}...
-                </p>
-                <div style="display: flex; gap: 0.5rem; flex-wrap: wrap;">
-
-                </div>
-                ${job.hr_email ?
-                    `<button onclick="applyForJob(${job.id})" class="primary-btn">Easy Apply with AI</button>` :
-                    `<a href="${job.url}" target="_blank" class="primary-btn" style="text-decoration: none; text-align: center; display: block;">Apply Manually</a>`
-                }
-            `;
-            container.appendChild(card);
-        });
-
     } catch (error) {
         loading.classList.add('hidden');
         showToast('Error searching jobs: ' + error.message);
@@ -220,8 +244,17 @@ async function loadApplications() {
     const container = document.getElementById('applications-container');
 
     try {
-        const response = await fetch(`${API_BASE_URL}/applications/${currentUser.id}`);
-        const applications = await response.json();
+        // The endpoint is paginated; follow X-Next-Cursor until the last page
+        const applications = [];
+        let cursor = null;
+        do {
+            const params = new URLSearchParams({ limit: 200 });
+            if (cursor) params.set('cursor', cursor);
+            const response = await fetch(`${API_BASE_URL}/applications/${currentUser.id}?${params}`);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            applications.push(...await response.json());
+            cursor = response.headers.get('X-Next-Cursor');
+        } while (cursor);
 
         container.innerHTML = '';
         if (applications.length === 0) {